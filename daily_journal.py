@@ -9,18 +9,42 @@ import os
 import subprocess
 import platform
 import json
-import time
 from datetime import datetime, timedelta
 import shutil
 import tempfile
 import re
 import html
+import functools
+import itertools
+import bisect
+import operator
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 
 # Configuration
 JOURNAL_DIR = os.path.expanduser("~/journal/daily")
 SETTINGS_FILE = os.path.expanduser("~/.daily_journal_settings.json")
 BACKUP_DIR = os.path.expanduser("~/journal/backups")
 
+# Buffer size for export files
+EXPORT_BUFFER_SIZE = 1 << 20
+
+# Buffer size for reading files being imported
+IMPORT_BUFFER_SIZE = 1 << 17
+
+# Host platform, looked up once
+_PLATFORM = platform.system()
+_PLATFORM_NAME = "Mac" if _PLATFORM == "Darwin" else "Linux/Windows"
+
+# Clipboard command for this platform (None where copying isn't supported)
+CLIPBOARD_COMMAND = {
+    "Darwin": ['pbcopy'],
+    "Linux": ['xclip', '-selection', 'clipboard'],
+    "Windows": ['clip'],
+}.get(_PLATFORM)
+CLIPBOARD_CHUNK_SIZE = 1 << 16
+
 # Default settings
 DEFAULT_SETTINGS = {
     "journal_directory": JOURNAL_DIR,
@@ -40,9 +64,92 @@ DEFAULT_SETTINGS = {
     "merge_detected_tags": True,
     "mac_keyboard_shortcuts": True,
     "auto_save_interval": 300,  # seconds
-    "export_directory": os.path.expanduser("~/journal/exports")
+    "export_directory": os.path.expanduser("~/journal/exports"),
+    "io_workers": 8,  # threads used to read files concurrently
+    "durable_save": False  # fsync journal files before replacing them
 }
 
+# Keyboard shortcuts (identical on Mac and Linux/Windows)
+_SHORTCUTS = MappingProxyType({
+    "new_blank_entry": 14,      # Ctrl+N
+    "new_template_entry": 20,   # Ctrl+T
+    "edit_today": 15,           # Ctrl+O
+    "search": 6,                # Ctrl+F
+    "backup": 2,                # Ctrl+B
+    "settings": 19,             # Ctrl+S
+    "help": 8,                  # Ctrl+H
+    "save": 19,                 # Ctrl+S
+    "quit": 17,                 # Ctrl+Q
+    "copy": 3,                  # Ctrl+C
+    "delete": 4,                # Ctrl+D
+    "line_start": 1,            # Ctrl+A
+    "line_end": 5,              # Ctrl+E
+    "word_left": 550,           # Ctrl+Left (Linux)
+    "word_right": 565,          # Ctrl+Right (Linux)
+    "alt_left": 548,            # Alt+Left (Linux)
+    "alt_right": 562,           # Alt+Right (Linux)
+})
+
+# Date format that get_today_filename() formats without strftime
+_FAST_DATE_FMT = "%Y-%m-%d"
+
+# Precompiled patterns
+_WORD_RE = re.compile(r'\S+')
+# A line whose stripped text starts with "# ", i.e. an entry heading
+_HEADING_RE = re.compile(r'^[^\S\n]*# [^\n]*\S', re.MULTILINE)
+_TAG_SANITIZE_RE = re.compile(r'[^a-zA-Z0-9_-]')
+# Regex syntax whose meaning depends on text outside the match (anchors, lookarounds)
+_REGEX_CONTEXT_RE = re.compile(r'[\^$]|\\[AZ]|\(\?<?[=!]')
+# ASCII whitespace that str patterns treat as \s but bytes patterns do not
+_INFO_SEPARATOR_RE = re.compile('[\x1c-\x1f]')
+_ASCII_NON_ALNUM = bytes(c for c in range(128) if not chr(c).isalnum())
+
+# Line breaks that safe_addstr() flattens to spaces
+_ADDSTR_TRANS = str.maketrans({'\n': ' ', '\r': ' '})
+
+# Rows kept in a list pad; curses pads can't exceed 32767 rows, so longer
+# lists keep only a window of rows and re-render it when scrolled past
+_LIST_PAD_ROWS = 1024
+
+# Cached (directory, mtime_ns, files) from the last get_daily_files() scan
+_DAILY_FILES_CACHE = None
+
+# Parsed entries per journal file path: {path: ((mtime_ns, size), entries)}
+_ENTRY_CACHE = {}
+
+# (files, stamps, entries) from the last get_all_entries() call; files is the
+# get_daily_files() list and stamps holds each file's (mtime_ns, size), since
+# editing a file in place does not change the directory's mtime
+_ALL_ENTRIES_CACHE = None
+
+# (entries, sorted tags) from the last get_all_tags() call; entries is the
+# get_all_entries() list, which is only rebuilt when a journal file changes
+_ALL_TAGS_CACHE = None
+
+# (entries, counts, sorted items) from the last get_tag_counts() call
+_TAG_COUNT_CACHE = None
+
+# (entries, columns) from the last get_entry_columns() call
+_ENTRY_COLUMNS_CACHE = None
+
+# Compiled word-count filter: None until first use, False if numba is unavailable
+_WORD_COUNT_KERNEL = None
+
+# JSON decoder for imports: None until first use, then orjson.loads or json.loads
+_JSON_LOADS = None
+
+# (mtime_ns, settings) from the last get_settings() call
+_SETTINGS_CACHE = None
+
+# Single background worker for prefetch_file_stats(), created on first use
+_PREFETCH_EXECUTOR = None
+
+# Future of the last prefetch, so reopening the picker doesn't queue another
+_PREFETCH_FUTURE = None
+
+# {path: (mtime_ns, size)} warmed by the last prefetch_file_stats() run
+_PREFETCHED_STAMPS = {}
+
 def load_settings():
     """Load settings from file"""
     try:
@@ -53,6 +160,8 @@ def load_settings():
 
 def save_settings(settings):
     """Save settings to file"""
+    global _SETTINGS_CACHE
+    _SETTINGS_CACHE = None
     try:
         with open(SETTINGS_FILE, 'w') as f:
             json.dump(settings, f, indent=2)
@@ -61,53 +170,27 @@ def save_settings(settings):
 
 def get_settings():
     """Get current settings"""
-    return load_settings()
+    global _SETTINGS_CACHE
+    try:
+        mtime = os.stat(SETTINGS_FILE).st_mtime_ns
+    except OSError:
+        mtime = None
+    if _SETTINGS_CACHE is None or _SETTINGS_CACHE[0] != mtime:
+        _SETTINGS_CACHE = (mtime, load_settings())
+    # Callers edit the returned dict before saving, so hand out a copy
+    return dict(_SETTINGS_CACHE[1])
+
+def get_io_workers():
+    """Get the number of threads to use for concurrent file reads"""
+    try:
+        return max(1, int(get_settings().get("io_workers", DEFAULT_SETTINGS["io_workers"])))
+    except (TypeError, ValueError):
+        return DEFAULT_SETTINGS["io_workers"]
 
 def get_platform_shortcuts():
     """Get platform-specific keyboard shortcuts"""
-    settings = get_settings()
-    use_mac_shortcuts = settings.get("mac_keyboard_shortcuts", True) and platform.system() == "Darwin"
-    
-    if use_mac_shortcuts:
-        return {
-            "new_blank_entry": 14,      # Ctrl+N (works on Mac)
-            "new_template_entry": 20,   # Ctrl+T (works on Mac)
-            "edit_today": 15,           # Ctrl+O (works on Mac)
-            "search": 6,                # Ctrl+F (works on Mac)
-            "backup": 2,                # Ctrl+B (works on Mac)
-            "settings": 19,             # Ctrl+S (works on Mac)
-            "help": 8,                  # Ctrl+H (works on Mac)
-            "save": 19,                 # Ctrl+S (works on Mac)
-            "quit": 17,                 # Ctrl+Q (works on Mac)
-            "copy": 3,                  # Ctrl+C (works on Mac)
-            "delete": 4,                # Ctrl+D (works on Mac)
-            "line_start": 1,            # Ctrl+A (works on Mac)
-            "line_end": 5,              # Ctrl+E (works on Mac)
-            "word_left": 550,           # Ctrl+Left (Linux)
-            "word_right": 565,          # Ctrl+Right (Linux)
-            "alt_left": 548,            # Alt+Left (Linux)
-            "alt_right": 562,           # Alt+Right (Linux)
-        }
-    else:
-        return {
-            "new_blank_entry": 14,      # Ctrl+N
-            "new_template_entry": 20,   # Ctrl+T
-            "edit_today": 15,           # Ctrl+O
-            "search": 6,                # Ctrl+F
-            "backup": 2,                # Ctrl+B
-            "settings": 19,             # Ctrl+S
-            "help": 8,                  # Ctrl+H
-            "save": 19,                 # Ctrl+S
-            "quit": 17,                 # Ctrl+Q
-            "copy": 3,                  # Ctrl+C
-            "delete": 4,                # Ctrl+D
-            "line_start": 1,            # Ctrl+A
-            "line_end": 5,              # Ctrl+E
-            "word_left": 550,           # Ctrl+Left (Linux)
-            "word_right": 565,          # Ctrl+Right (Linux)
-            "alt_left": 548,            # Alt+Left (Linux)
-            "alt_right": 562,           # Alt+Right (Linux)
-        }
+    # The same control codes work on every platform, so one shared table serves all
+    return _SHORTCUTS
 
 def ensure_directories():
     """Ensure journal and backup directories exist"""
@@ -115,6 +198,21 @@ def ensure_directories():
     os.makedirs(settings["journal_directory"], exist_ok=True)
     os.makedirs(settings["backup_directory"], exist_ok=True)
 
+def _parse_compact_date(date_str):
+    """Parse a YYYYMMDD string into a datetime without going through strptime"""
+    if len(date_str) == 8 and date_str.isdigit() and date_str.isascii():
+        return datetime(int(date_str[0:4]), int(date_str[4:6]), int(date_str[6:8]))
+    return datetime.strptime(date_str, "%Y%m%d")
+
+def _parse_compact_timestamp(ts_str):
+    """Parse a YYYYMMDD_HHMMSS string into a datetime without going through strptime"""
+    date_part, sep, time_part = ts_str[:8], ts_str[8:9], ts_str[9:]
+    if (sep == '_' and date_part.isdigit() and time_part.isdigit()
+            and date_part.isascii() and time_part.isascii()):
+        return datetime(int(date_part[0:4]), int(date_part[4:6]), int(date_part[6:8]),
+                        int(time_part[0:2]), int(time_part[2:4]), int(time_part[4:6]))
+    return datetime.strptime(ts_str, "%Y%m%d_%H%M%S")
+
 def create_backup(filename=None):
     """Create backup of journal files, but only if not already backed up this period"""
     settings = get_settings()
@@ -140,11 +238,11 @@ def create_backup(filename=None):
                     continue
                 try:
                     ts_str = parts[1]
-                    ts = datetime.strptime(ts_str, "%Y%m%d") if len(ts_str) == 8 else None
+                    ts = _parse_compact_date(ts_str) if len(ts_str) == 8 else None
                     if not ts and len(ts_str) >= 15:
-                        ts = datetime.strptime(ts_str[:15], "%Y%m%d_%H%M%S")
+                        ts = _parse_compact_timestamp(ts_str[:15])
                     elif not ts and len(ts_str) >= 8:
-                        ts = datetime.strptime(ts_str[:8], "%Y%m%d")
+                        ts = _parse_compact_date(ts_str[:8])
                     if ts:
                         timestamps.append(ts)
                 except Exception:
@@ -185,11 +283,20 @@ def create_backup(filename=None):
                 pass  # Ignore errors during backup
 
 def get_file_stats(filepath):
-    """Get file statistics"""
+    """Get file statistics (cached until the file changes)"""
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return {"words": 0, "lines": 0, "chars": 0, "entries": 0}
+    return _file_stats_for(filepath, st.st_mtime_ns, st.st_size)
+
+@functools.lru_cache(maxsize=256)
+def _file_stats_for(filepath, mtime_ns, size):
+    """Compute file statistics; mtime_ns and size only key the cache"""
     try:
         with open(filepath, 'r', encoding='utf-8') as f:
             content = f.read()
-            words = len(content.split())
+            words = get_word_count(content)
             lines = content.count('\n') + 1
             chars = len(content)
             
@@ -200,53 +307,194 @@ def get_file_stats(filepath):
     except:
         return {"words": 0, "lines": 0, "chars": 0, "entries": 0}
 
+def prefetch_file_stats(filepaths):
+    """Warm the file stats cache in the background, reading files in on-disk order"""
+    global _PREFETCH_EXECUTOR, _PREFETCH_FUTURE
+    # A prefetch still running covers the same files; don't stack another behind it
+    if _PREFETCH_FUTURE is not None and not _PREFETCH_FUTURE.done():
+        return
+    
+    def warm():
+        global _PREFETCHED_STAMPS
+        warmed = _PREFETCHED_STAMPS
+        found = []
+        stamps = {}
+        for path in filepaths[:_file_stats_for.cache_info().maxsize]:
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            stamps[path] = (st.st_mtime_ns, st.st_size)
+            # Skip files already warmed and unchanged since
+            if warmed.get(path) != stamps[path]:
+                found.append((st.st_ino, path, st.st_mtime_ns, st.st_size))
+        # Inode order roughly follows disk layout, keeping the reads sequential
+        found.sort()
+        for _, path, mtime_ns, size in found:
+            _file_stats_for(path, mtime_ns, size)
+        _PREFETCHED_STAMPS = stamps
+    
+    if _PREFETCH_EXECUTOR is None:
+        _PREFETCH_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+    _PREFETCH_FUTURE = _PREFETCH_EXECUTOR.submit(warm)
+
+def _parse_ymd(date_str):
+    """Parse a YYYY-MM-DD string into a datetime without going through strptime"""
+    if len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-':
+        year, month, day = date_str[0:4], date_str[5:7], date_str[8:10]
+        if year.isdigit() and month.isdigit() and day.isdigit():
+            return datetime(int(year), int(month), int(day))
+    # Anything unusual gets strptime's exact semantics
+    return datetime.strptime(date_str, "%Y-%m-%d")
+
 def get_daily_files():
-    """Get list of daily journal files"""
-    ensure_directories()
+    """Get list of daily journal files (cached until the directory changes)"""
+    global _DAILY_FILES_CACHE
     settings = get_settings()
+    journal_dir = settings["journal_directory"]
     try:
-        files = [f for f in os.listdir(settings["journal_directory"]) if f.endswith('.md')]
-        return sorted(files, reverse=True)  # Most recent first
+        # A cache hit costs one stat; the directories are only created on a miss
+        try:
+            mtime = os.stat(journal_dir).st_mtime_ns
+        except FileNotFoundError:
+            ensure_directories()
+            mtime = os.stat(journal_dir).st_mtime_ns
+        cache = _DAILY_FILES_CACHE
+        if cache is not None and cache[0] == journal_dir and cache[1] == mtime:
+            return cache[2]
+        ensure_directories()
+        # scandir's entry types come from the directory listing itself, no per-file stat needed
+        with os.scandir(journal_dir) as it:
+            files = [entry.name for entry in it if entry.name.endswith('.md') and entry.is_file()]
+        files.sort(reverse=True)  # Most recent first
+        _DAILY_FILES_CACHE = (journal_dir, mtime, files)
+        return files
     except Exception as e:
         return []
 
 def get_today_filename():
     """Get filename for today's journal"""
     settings = get_settings()
-    date_str = datetime.now().strftime(settings["date_format"])
+    now = datetime.now()
+    if settings["date_format"] == _FAST_DATE_FMT:
+        return f"{now.year:04d}-{now.month:02d}-{now.day:02d}.md"
+    date_str = now.strftime(settings["date_format"])
     return f"{date_str}.md"
 
+@functools.lru_cache(maxsize=8)
+def _encoded_dir_prefix(directory):
+    """Return directory with a trailing separator, encoded for bytes paths"""
+    return os.fsencode(os.path.join(directory, ''))
+
 def read_daily_file(filename):
     """Read a daily journal file and return its content"""
-    settings = get_settings()
-    filepath = os.path.join(settings["journal_directory"], filename)
+    journal_dir = get_settings()["journal_directory"]
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-            return content
+        with open(_encoded_dir_prefix(journal_dir) + os.fsencode(filename), 'rb') as f:
+            content = f.read().decode('utf-8')
+        # Match text-mode universal newlines
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content
     except FileNotFoundError:
+        filepath = os.path.join(journal_dir, filename)
         return f"File not found: {filepath}\n\nPlease check if the file exists and the journal directory is correct."
     except PermissionError:
+        filepath = os.path.join(journal_dir, filename)
         return f"Permission denied: {filepath}\n\nPlease check file permissions."
     except UnicodeDecodeError as e:
         return f"Encoding error reading file: {e}\n\nFile may be corrupted or use a different encoding."
     except Exception as e:
+        filepath = os.path.join(journal_dir, filename)
         return f"Error reading file: {e}\n\nFilepath: {filepath}"
 
 def write_daily_file(filename, content):
     """Write content to a daily journal file"""
+    _write_daily_chunks(filename, [content.encode('utf-8')])
+
+def write_daily_file_lines(filename, lines):
+    """Write a daily journal file from its lines without joining them into one string"""
+    _write_daily_chunks(filename, [line.encode('utf-8') for line in lines], b'\n')
+
+def _chunks_match(data, chunks, sep):
+    """Check whether data equals sep.join(chunks) without building the joined bytes"""
+    view = memoryview(data)
+    pos = 0
+    for i, chunk in enumerate(chunks):
+        if i and sep:
+            if view[pos:pos + len(sep)] != sep:
+                return False
+            pos += len(sep)
+        if view[pos:pos + len(chunk)] != chunk:
+            return False
+        pos += len(chunk)
+    return pos == len(data)
+
+def _write_daily_chunks(filename, chunks, sep=b''):
+    """Write sep.join(chunks) to a daily journal file, streaming the pieces"""
+    global _DAILY_FILES_CACHE, _ALL_ENTRIES_CACHE, _ALL_TAGS_CACHE, _TAG_COUNT_CACHE
+    global _PREFETCHED_STAMPS
     settings = get_settings()
     filepath = os.path.join(settings["journal_directory"], filename)
     
+    try:
+        with open(filepath, 'rb') as f:
+            existing = f.read()
+    except FileNotFoundError:
+        existing = None
+    
+    # Nothing to do (and nothing to back up) if the content is unchanged
+    if existing is not None and _chunks_match(existing, chunks, sep):
+        return
+    
     # Create backup before writing
-    if os.path.exists(filepath):
+    if existing is not None:
         create_backup(filename)
     
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(content)
+    # Write to a temporary file and swap it in so a crash can't leave a half-written journal.
+    # Swap in at the link target so a symlinked journal file stays a symlink.
+    target = os.path.realpath(filepath)
+    temp_path = target + '.tmp'
+    try:
+        with open(temp_path, 'wb') as f:
+            # Keep the original permissions (e.g. a private 0600 journal) before any text lands
+            if existing is not None:
+                shutil.copymode(target, temp_path)
+            for i, chunk in enumerate(chunks):
+                if i and sep:
+                    f.write(sep)
+                f.write(chunk)
+            if settings.get("durable_save", False):
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temp_path, target)
+    except:
+        # Don't leave a stray temp file in the journal directory
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+    # New files must show up immediately, even within the same mtime tick
+    _DAILY_FILES_CACHE = None
+    _ALL_ENTRIES_CACHE = None
+    # Likewise a rewrite must be reparsed even if its mtime did not move
+    _ENTRY_CACHE.pop(filepath, None)
+    # Tag summaries and file stats are keyed by mtime, which may not tick between quick saves
+    _ALL_TAGS_CACHE = None
+    _TAG_COUNT_CACHE = None
+    _file_stats_for.cache_clear()
+    _PREFETCHED_STAMPS = {}
 
 def append_to_daily_file(filename, entry_content):
     """Append a new entry to a daily journal file"""
+    append_many_to_daily_file(filename, [entry_content])
+
+def append_many_to_daily_file(filename, entry_contents):
+    """Append several entries to a daily journal file with a single write"""
+    if not entry_contents:
+        return
+    
     settings = get_settings()
     filepath = os.path.join(settings["journal_directory"], filename)
     
@@ -257,11 +505,11 @@ def append_to_daily_file(filename, entry_content):
     except:
         existing_content = ""
     
-    # Add new entry
+    # Add new entries
     if existing_content:
-        new_content = existing_content + "\n\n" + entry_content
+        new_content = "\n\n".join([existing_content, *entry_contents])
     else:
-        new_content = entry_content
+        new_content = "\n\n".join(entry_contents)
     
     # Write back to file
     write_daily_file(filename, new_content)
@@ -270,10 +518,32 @@ def is_enter_key(key):
     """Check if the key is any form of enter key"""
     return key in (10, 13, 459, curses.KEY_ENTER, ord('\r'))
 
+def step_menu_row(selectable, current_row, step):
+    """Move a menu selection one row up (step -1) or down (step 1), skipping blank rows"""
+    if step > 0:
+        pos = bisect.bisect_right(selectable, current_row)
+    else:
+        pos = bisect.bisect_left(selectable, current_row) - 1
+    return selectable[pos % len(selectable)]
+
 def is_selection_key(key):
     """Check if the key is a selection key (Enter or Space)"""
     return key in (10, 13, 459, curses.KEY_ENTER, ord('\r'), 32)
 
+def get_key_batch(stdscr):
+    """Wait for a key, then collect any keys already queued behind it"""
+    keys = [stdscr.getch()]
+    stdscr.nodelay(True)
+    try:
+        while True:
+            key = stdscr.getch()
+            if key == -1:
+                break
+            keys.append(key)
+    finally:
+        stdscr.nodelay(False)
+    return keys
+
 def safe_addstr(stdscr, y, x, text, attr=0):
     """Safely add string to screen with truncation and error handling"""
     try:
@@ -296,7 +566,9 @@ def safe_addstr(stdscr, y, x, text, attr=0):
                 text = text[:max_chars]
         
         # Ensure text doesn't contain problematic characters
-        text = str(text).replace('\n', ' ').replace('\r', ' ')
+        if not isinstance(text, str):
+            text = str(text)
+        text = text.translate(_ADDSTR_TRANS)
         
         # Add the string with error handling
         try:
@@ -318,6 +590,35 @@ def safe_addstr(stdscr, y, x, text, attr=0):
     except Exception:
         return False
 
+def make_list_pad(count, width, draw_item):
+    """Draw a scrolling list of count items through a bounded pad
+    
+    draw_item(pad, y, i) paints item i on pad row y. Returns (redraw_item, show):
+    redraw_item(i) repaints one item if it is in the pad, and show(top, y, rows)
+    stages items top..top+rows-1 at screen row y for the next doupdate().
+    """
+    pad_rows = min(count, _LIST_PAD_ROWS)
+    pad = curses.newpad(pad_rows + 1, width)
+    base = None  # item shown on pad row 0
+    
+    def redraw_item(i):
+        if base is not None and base <= i < base + pad_rows:
+            pad.move(i - base, 0)
+            pad.clrtoeol()
+            draw_item(pad, i - base, i)
+    
+    def show(top, y, rows):
+        nonlocal base
+        if base is None or top < base or min(top + rows, count) > base + pad_rows:
+            # Centre the window on the view so nearby scrolling stays inside it
+            base = max(0, min(top - (pad_rows - rows) // 2, count - pad_rows))
+            pad.erase()
+            for i in range(base, base + pad_rows):
+                draw_item(pad, i - base, i)
+        pad.noutrefresh(top - base, 0, y, 0, y + rows - 1, width - 1)
+    
+    return redraw_item, show
+
 def show_status_bar(stdscr, text, stats=None):
     """Show status bar at bottom of screen"""
     height, width = stdscr.getmaxyx()
@@ -336,6 +637,20 @@ def show_status_bar(stdscr, text, stats=None):
     except:
         pass
 
+def flash_status(stdscr, text, delay_ms=1000):
+    """Show a status message for up to delay_ms, returning early on a keypress"""
+    show_status_bar(stdscr, text)
+    stdscr.refresh()
+    # Wait on input instead of sleeping so a keypress cuts the pause short;
+    # the key is pushed back so the caller still sees it
+    stdscr.timeout(delay_ms)
+    try:
+        key = stdscr.getch()
+    finally:
+        stdscr.timeout(-1)
+    if key != -1:
+        curses.ungetch(key)
+
 def input_with_prefill(stdscr, y, x, prefill, max_width=None):
     """Enhanced input with prefill and better editing"""
     curses.curs_set(1)
@@ -403,8 +718,22 @@ def input_with_prefill(stdscr, y, x, prefill, max_width=None):
             pos = len(buffer)
             redraw_buffer()
         elif 32 <= key <= 126:
-            buffer.insert(pos, chr(key))
-            pos += 1
+            # Drain the rest of a paste so it costs one redraw, not one per char
+            typed = [chr(key)]
+            stdscr.nodelay(True)
+            try:
+                while True:
+                    key = stdscr.getch()
+                    if key == -1:
+                        break
+                    if not 32 <= key <= 126:
+                        curses.ungetch(key)
+                        break
+                    typed.append(chr(key))
+            finally:
+                stdscr.nodelay(False)
+            buffer[pos:pos] = typed
+            pos += len(typed)
             redraw_buffer()
     
     curses.curs_set(0)
@@ -412,20 +741,32 @@ def input_with_prefill(stdscr, y, x, prefill, max_width=None):
 
 def copy_entry_to_clipboard(entry_content):
     """Copy entry content to clipboard (platform specific)"""
-    try:
-        if platform.system() == "Darwin":  # macOS
-            subprocess.run(['pbcopy'], input=entry_content.encode(), check=True)
-        elif platform.system() == "Linux":
-            subprocess.run(['xclip', '-selection', 'clipboard'], input=entry_content.encode(), check=True)
-        elif platform.system() == "Windows":
-            subprocess.run(['clip'], input=entry_content.encode(), check=True)
+    if CLIPBOARD_COMMAND is None:
         return True
+    try:
+        proc = subprocess.Popen(CLIPBOARD_COMMAND, stdin=subprocess.PIPE)
+        try:
+            # Encode and send in chunks so a huge entry isn't duplicated as bytes
+            with proc.stdin:
+                for start in range(0, len(entry_content), CLIPBOARD_CHUNK_SIZE):
+                    proc.stdin.write(entry_content[start:start + CLIPBOARD_CHUNK_SIZE].encode())
+        finally:
+            returncode = proc.wait()
+        return returncode == 0
     except:
         return False
 
 def get_word_count(content):
     """Get word count of content"""
-    return len(content.split())
+    return sum(1 for _ in _WORD_RE.finditer(content))
+
+def _word_count_delta(chars, i, ch):
+    """Change in word count from inserting ch at index i of chars"""
+    left = i > 0 and not chars[i - 1].isspace()
+    right = i < len(chars) and not chars[i].isspace()
+    if ch.isspace():
+        return 1 if left and right else 0
+    return 0 if left or right else 1
 
 def format_timestamp():
     """Get formatted timestamp for entries"""
@@ -443,7 +784,8 @@ def ensure_export_directory():
 def export_to_text(entries_data, export_path, date_range=None):
     """Export entries to plain text format"""
     try:
-        with open(export_path, 'w', encoding='utf-8') as f:
+        separator = "-" * 40
+        with open(export_path, 'w', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
             f.write("Daily Journal Export\n")
             f.write("=" * 50 + "\n")
             f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
@@ -451,13 +793,14 @@ def export_to_text(entries_data, export_path, date_range=None):
             if date_range:
                 f.write(f"Date Range: {date_range['start']} to {date_range['end']}\n\n")
             
+            # One write per entry keeps encoder calls proportional to entries, not lines
             for entry in entries_data:
-                f.write(f"Date: {entry['filename'].replace('.md', '')}\n")
-                f.write(f"Title: {entry['title']}\n")
-                if entry['tags']:
-                    f.write(f"Tags: {entry['tags']}\n")
-                f.write("-" * 40 + "\n")
-                f.write(f"{entry['content']}\n\n")
+                tags_line = f"Tags: {entry['tags']}\n" if entry['tags'] else ""
+                f.write(f"Date: {entry['filename'].replace('.md', '')}\n"
+                        f"Title: {entry['title']}\n"
+                        f"{tags_line}"
+                        f"{separator}\n"
+                        f"{entry['content']}\n\n")
         return True
     except Exception as e:
         return False, str(e)
@@ -465,7 +808,7 @@ def export_to_text(entries_data, export_path, date_range=None):
 def export_to_html(entries_data, export_path, date_range=None):
     """Export entries to HTML format with CSS styling"""
     try:
-        # Build HTML content more carefully to avoid formatting issues
+        # Build the header up front, then stream each entry straight to the file
         html_parts = []
         
         # Header
@@ -545,45 +888,46 @@ def export_to_html(entries_data, export_path, date_range=None):
         
         # Add date range if provided
         if date_range:
-            html_parts.append(f"        <p>Date Range: {date_range['start']} to {date_range['end']}</p>")
+            safe_start = html.escape(str(date_range['start']))
+            safe_end = html.escape(str(date_range['end']))
+            html_parts.append(f"        <p>Date Range: {safe_start} to {safe_end}</p>")
         
         html_parts.append("    </div>")
         
-        # Add entries
-        for entry in entries_data:
-            # Escape HTML content to prevent formatting issues
-            safe_title = html.escape(entry.get('title', ''))
-            safe_content = html.escape(entry.get('content', ''))
-            safe_filename = html.escape(entry.get('filename', '').replace('.md', ''))
-            
-            html_parts.append("    <div class=\"entry\">")
-            html_parts.append(f"        <div class=\"entry-date\">📅 {safe_filename}</div>")
-            html_parts.append(f"        <div class=\"entry-title\">{safe_title}</div>")
+        with open(export_path, 'w', encoding='utf-8') as f:
+            f.write("\n".join(html_parts))
             
-            if entry.get('tags'):
-                html_parts.append("        <div class=\"entry-tags\">")
-                for tag in entry['tags'].split(','):
-                    tag = tag.strip()
-                    if tag:
-                        safe_tag = html.escape(tag)
-                        html_parts.append(f"            <span class=\"tag\">{safe_tag}</span>")
-                html_parts.append("        </div>")
+            # Add entries, one fragment per write so memory stays flat
+            for entry in entries_data:
+                # Escape HTML content to prevent formatting issues
+                safe_title = html.escape(entry.get('title', ''))
+                safe_content = html.escape(entry.get('content', ''))
+                safe_filename = html.escape(entry.get('filename', '').replace('.md', ''))
+                safe_tags = html.escape(entry.get('tags') or '')
+                
+                entry_parts = ["", "    <div class=\"entry\">"]
+                entry_parts.append(f"        <div class=\"entry-date\">📅 {safe_filename}</div>")
+                entry_parts.append(f"        <div class=\"entry-title\">{safe_title}</div>")
+                
+                if safe_tags:
+                    entry_parts.append("        <div class=\"entry-tags\">")
+                    for tag in safe_tags.split(','):
+                        tag = tag.strip()
+                        if tag:
+                            entry_parts.append(f"            <span class=\"tag\">{tag}</span>")
+                    entry_parts.append("        </div>")
+                
+                entry_parts.append(f"        <div class=\"entry-content\">{safe_content}</div>")
+                entry_parts.append("    </div>")
+                f.write("\n".join(entry_parts))
             
-            html_parts.append(f"        <div class=\"entry-content\">{safe_content}</div>")
-            html_parts.append("    </div>")
-        
-        # Footer
-        html_parts.append("""    <div class="footer">
+            # Footer
+            f.write("""
+    <div class="footer">
         <p>Generated by Daily Journal Terminal Application</p>
     </div>
 </body>
 </html>""")
-        
-        # Join all parts and write to file
-        html_content = "\n".join(html_parts)
-        
-        with open(export_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
         return True
     except Exception as e:
         return False, str(e)
@@ -674,35 +1018,47 @@ def export_entries_menu(stdscr):
         "Back"
     ]
 
+    selectable = [i for i, item in enumerate(menu) if item]
+    redraw_needed = True
     while True:
-        stdscr.clear()
-        safe_addstr(stdscr, 0, 0, "📤 Export Journal Entries")
-        safe_addstr(stdscr, 1, 0, "Choose export format and scope")
-        
-        export_dir = ensure_export_directory()
-        show_status_bar(stdscr, f"Export directory: {export_dir}")
-        
-        y_pos = 3
-        for idx, item in enumerate(menu):
-            if item == "":
-                y_pos += 1
-                continue
-            attr = curses.A_REVERSE if idx == current_row else 0
-            safe_addstr(stdscr, y_pos, 2, f"> {item}" if idx == current_row else f"  {item}", attr)
-            y_pos += 1
+        if redraw_needed:
+            stdscr.clear()
+            safe_addstr(stdscr, 0, 0, "📤 Export Journal Entries")
+            safe_addstr(stdscr, 1, 0, "Choose export format and scope")
             
-        key = stdscr.getch()
+            export_dir = ensure_export_directory()
+            show_status_bar(stdscr, f"Export directory: {export_dir}")
+            
+            y_pos = 3
+            for idx, item in enumerate(menu):
+                if item == "":
+                    y_pos += 1
+                    continue
+                attr = curses.A_REVERSE if idx == current_row else 0
+                safe_addstr(stdscr, y_pos, 2, f"> {item}" if idx == current_row else f"  {item}", attr)
+                y_pos += 1
+            redraw_needed = False
+        
+        # Apply every queued navigation key before drawing again
+        keys = get_key_batch(stdscr)
+        key = None
+        for i, pending in enumerate(keys):
+            if pending == curses.KEY_UP:
+                current_row = step_menu_row(selectable, current_row, -1)
+                redraw_needed = True
+            elif pending == curses.KEY_DOWN:
+                current_row = step_menu_row(selectable, current_row, 1)
+                redraw_needed = True
+            elif is_selection_key(pending) or pending == 27:
+                key = pending
+                # Leave anything typed after this key for the next screen
+                for later in reversed(keys[i + 1:]):
+                    curses.ungetch(later)
+                break
         
-        if key == curses.KEY_UP:
-            current_row = (current_row - 1) % len(menu)
-            while current_row > 0 and menu[current_row] == "":
-                current_row = (current_row - 1) % len(menu)
-        elif key == curses.KEY_DOWN:
-            current_row = (current_row + 1) % len(menu)
-            while current_row < len(menu) - 1 and menu[current_row] == "":
-                current_row = (current_row + 1) % len(menu)
-        elif is_selection_key(key):
+        if key is not None and is_selection_key(key):
             selected_item = menu[current_row]
+            redraw_needed = True
             
             if "Export All Entries" in selected_item:
                 format_type = selected_item.split("(")[1].split(")")[0].lower()
@@ -793,18 +1149,19 @@ def export_date_range(stdscr, format_type):
         stdscr.getch()
         return
     
-    # Filter entries by date range
-    all_entries = get_all_entries()
-    filtered_entries = []
+    # Filter files by the date in their name before reading any of them
+    files_in_range = []
     
-    for entry in all_entries:
+    for daily_file in get_daily_files():
         try:
-            entry_date = datetime.strptime(entry['filename'].replace('.md', ''), "%Y-%m-%d")
-            if start_dt <= entry_date <= end_dt:
-                filtered_entries.append(entry)
+            file_date = _parse_ymd(daily_file[:-3])
+            if start_dt <= file_date <= end_dt:
+                files_in_range.append(daily_file)
         except ValueError:
             continue
     
+    filtered_entries = get_entries_from_files(files_in_range)
+    
     if not filtered_entries:
         safe_addstr(stdscr, 5, 0, f"No entries found in date range {start_date} to {end_date}")
         safe_addstr(stdscr, 6, 0, "Press any key to continue...")
@@ -866,14 +1223,7 @@ def export_by_tags(stdscr, format_type):
     
     # Filter entries by tags
     all_entries = get_all_entries()
-    filtered_entries = []
-    
-    for entry in all_entries:
-        if entry['tags']:
-            entry_tags = [tag.strip().lower() for tag in entry['tags'].split(',')]
-            # Check if any target tags match entry tags
-            if any(target_tag in entry_tags for target_tag in target_tags):
-                filtered_entries.append(entry)
+    filtered_entries = filter_entries_by_tags(all_entries, target_tags)
     
     if not filtered_entries:
         safe_addstr(stdscr, 4, 0, f"No entries found with tags: {tags_input}")
@@ -883,7 +1233,7 @@ def export_by_tags(stdscr, format_type):
     
     export_dir = ensure_export_directory()
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    safe_tags = re.sub(r'[^a-zA-Z0-9_-]', '_', tags_input.replace(',', '_'))
+    safe_tags = _TAG_SANITIZE_RE.sub('_', tags_input.replace(',', '_'))
     filename = f"journal_export_tags_{safe_tags}_{timestamp}.{format_type}"
     export_path = os.path.join(export_dir, filename)
     
@@ -910,6 +1260,18 @@ def export_by_tags(stdscr, format_type):
     safe_addstr(stdscr, 6, 0, "Press any key to continue...")
     stdscr.getch()
 
+def read_import_file(file_path, drop_cache=False):
+    """Read a file being imported through a large buffer"""
+    with open(file_path, 'r', encoding='utf-8', buffering=IMPORT_BUFFER_SIZE) as f:
+        can_advise = hasattr(os, 'posix_fadvise')
+        if can_advise:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        content = f.read()
+        # Files read once for a batch shouldn't push the journal out of the page cache
+        if can_advise and drop_cache:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+    return content
+
 def import_entries_menu(stdscr):
     """Import entries from various formats"""
     current_row = 0
@@ -922,7 +1284,17 @@ def import_entries_menu(stdscr):
         "",
         "Back"
     ]
+    
+    # Dispatch on row index so selecting an item needs no label matching
+    handlers = {
+        0: import_text_files,
+        1: import_markdown_files,
+        2: import_json_export,
+        4: batch_import_directory,
+    }
+    back_row = menu.index("Back")
 
+    selectable = [i for i, item in enumerate(menu) if item]
     while True:
         stdscr.clear()
         safe_addstr(stdscr, 0, 0, "📥 Import Journal Entries")
@@ -943,26 +1315,15 @@ def import_entries_menu(stdscr):
         key = stdscr.getch()
         
         if key == curses.KEY_UP:
-            current_row = (current_row - 1) % len(menu)
-            while current_row > 0 and menu[current_row] == "":
-                current_row = (current_row - 1) % len(menu)
+            current_row = step_menu_row(selectable, current_row, -1)
         elif key == curses.KEY_DOWN:
-            current_row = (current_row + 1) % len(menu)
-            while current_row < len(menu) - 1 and menu[current_row] == "":
-                current_row = (current_row + 1) % len(menu)
+            current_row = step_menu_row(selectable, current_row, 1)
         elif is_selection_key(key):
-            selected_item = menu[current_row]
-            
-            if "Import from Text Files" in selected_item:
-                import_text_files(stdscr)
-            elif "Import from Markdown Files" in selected_item:
-                import_markdown_files(stdscr)
-            elif "Import from JSON Export" in selected_item:
-                import_json_export(stdscr)
-            elif "Batch Import from Directory" in selected_item:
-                batch_import_directory(stdscr)
-            elif "Back" in selected_item:
+            if current_row == back_row:
                 break
+            handler = handlers.get(current_row)
+            if handler is not None:
+                handler(stdscr)
         elif key == 27:  # ESC
             break
 
@@ -987,8 +1348,7 @@ def import_text_files(stdscr):
         return
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = read_import_file(file_path)
         
         # Create a new entry with the imported content
         title = f"Imported from {os.path.basename(file_path)}"
@@ -1028,8 +1388,7 @@ def import_markdown_files(stdscr):
         return
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = read_import_file(file_path)
         
         # Try to detect existing entries or import as single entry
         entries = parse_entries_from_content(content, os.path.basename(file_path))
@@ -1038,6 +1397,7 @@ def import_markdown_files(stdscr):
             # Import detected entries
             today_file = get_today_filename()
             imported_count = 0
+            entry_contents = []
             
             for entry in entries:
                 # Format entry with tags at the end
@@ -1052,9 +1412,11 @@ def import_markdown_files(stdscr):
                     entry_content += "\n\n@imported"
                 
                 entry_content += "\n"
-                append_to_daily_file(today_file, entry_content)
+                entry_contents.append(entry_content)
                 imported_count += 1
             
+            append_many_to_daily_file(today_file, entry_contents)
+            
             safe_addstr(stdscr, 4, 0, f"✅ Import successful!")
             safe_addstr(stdscr, 5, 0, f"Imported {imported_count} entries to: {today_file}")
         else:
@@ -1097,23 +1459,28 @@ def import_json_export(stdscr):
         return
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_json_file(file_path)
         
         # Import entries from JSON structure
         imported_count = 0
+        entries_by_file = {}
+        # One timestamp for the whole import session
+        timestamp = format_timestamp()
         for entry_data in data:
             if isinstance(entry_data, dict) and 'title' in entry_data and 'content' in entry_data:
                 title = entry_data.get('title', 'Untitled')
                 content = entry_data.get('content', '')
                 tags = entry_data.get('tags', 'imported')
                 
-                entry_content = f"# {format_timestamp()}{title}\n\ntags: {tags}\n\n{content}\n"
+                entry_content = f"# {timestamp}{title}\n\ntags: {tags}\n\n{content}\n"
                 
                 today_file = get_today_filename()
-                append_to_daily_file(today_file, entry_content)
+                entries_by_file.setdefault(today_file, []).append(entry_content)
                 imported_count += 1
         
+        for today_file, entry_contents in entries_by_file.items():
+            append_many_to_daily_file(today_file, entry_contents)
+        
         safe_addstr(stdscr, 4, 0, f"✅ Import successful!")
         safe_addstr(stdscr, 5, 0, f"Imported {imported_count} entries")
         
@@ -1146,53 +1513,72 @@ def batch_import_directory(stdscr):
     try:
         imported_files = 0
         imported_entries = 0
+        # Group entries by target file (the date can roll over mid-import) and write each once
+        entries_by_file = {}
         
-        for filename in os.listdir(dir_path):
-            file_path = os.path.join(dir_path, filename)
-            if os.path.isfile(file_path) and (filename.endswith('.txt') or filename.endswith('.md')):
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
-                    if filename.endswith('.md'):
-                        # Try to parse as entries
-                        entries = parse_entries_from_content(content, filename)
-                        if entries:
-                            for entry in entries:
-                                # Format entry with tags at the end
-                                entry_content = f"# {entry['title']}\n\n{entry['content']}"
-                                if entry['tags']:
-                                    # Add imported tag
-                                    tags = entry['tags'] + ", imported"
-                                    tag_list = [tag.strip() for tag in tags.split(',') if tag.strip()]
-                                    if tag_list:
-                                        entry_content += f"\n\n{' '.join([f'@{tag}' for tag in tag_list])}"
-                                else:
-                                    entry_content += "\n\n@imported"
-                                
-                                entry_content += "\n"
-                                today_file = get_today_filename()
-                                append_to_daily_file(today_file, entry_content)
-                                imported_entries += 1
-                        else:
-                            # Import as single entry
-                            title = f"Imported from {filename}"
-                            entry_content = f"# {title}\n\n{content}\n\n@imported @batch\n"
+        # Collect candidate files first so they can be read concurrently
+        candidates = []
+        with os.scandir(dir_path) as dir_entries:
+            for dir_entry in dir_entries:
+                if dir_entry.is_file() and dir_entry.name.endswith(('.txt', '.md')):
+                    candidates.append((dir_entry.name, dir_entry.path))
+        
+        def read_candidate(file_path):
+            try:
+                return read_import_file(file_path, drop_cache=True)
+            except Exception:
+                return None  # Skip files that can't be read
+        
+        with ThreadPoolExecutor(max_workers=get_io_workers()) as executor:
+            contents = list(executor.map(read_candidate, [path for _, path in candidates]))
+        
+        for (filename, _), content in zip(candidates, contents):
+            if content is None:
+                continue
+            
+            try:
+                if filename.endswith('.md'):
+                    # Try to parse as entries
+                    entries = parse_entries_from_content(content, filename)
+                    if entries:
+                        for entry in entries:
+                            # Format entry with tags at the end
+                            entry_content = f"# {entry['title']}\n\n{entry['content']}"
+                            if entry['tags']:
+                                # Add imported tag
+                                tags = entry['tags'] + ", imported"
+                                tag_list = [tag.strip() for tag in tags.split(',') if tag.strip()]
+                                if tag_list:
+                                    entry_content += f"\n\n{' '.join([f'@{tag}' for tag in tag_list])}"
+                            else:
+                                entry_content += "\n\n@imported"
+                            
+                            entry_content += "\n"
                             today_file = get_today_filename()
-                            append_to_daily_file(today_file, entry_content)
+                            entries_by_file.setdefault(today_file, []).append(entry_content)
                             imported_entries += 1
                     else:
-                        # Import text file as single entry
+                        # Import as single entry
                         title = f"Imported from {filename}"
                         entry_content = f"# {title}\n\n{content}\n\n@imported @batch\n"
                         today_file = get_today_filename()
-                        append_to_daily_file(today_file, entry_content)
+                        entries_by_file.setdefault(today_file, []).append(entry_content)
                         imported_entries += 1
-                    
-                    imported_files += 1
-                    
-                except Exception:
-                    continue  # Skip files that can't be read
+                else:
+                    # Import text file as single entry
+                    title = f"Imported from {filename}"
+                    entry_content = f"# {title}\n\n{content}\n\n@imported @batch\n"
+                    today_file = get_today_filename()
+                    entries_by_file.setdefault(today_file, []).append(entry_content)
+                    imported_entries += 1
+                
+                imported_files += 1
+                
+            except Exception:
+                continue
+        
+        for today_file, entry_contents in entries_by_file.items():
+            append_many_to_daily_file(today_file, entry_contents)
         
         safe_addstr(stdscr, 4, 0, f"✅ Batch import successful!")
         safe_addstr(stdscr, 5, 0, f"Files processed: {imported_files}")
@@ -1222,7 +1608,19 @@ def advanced_search_menu(stdscr):
         "",
         "Back"
     ]
+    
+    # Dispatch on row index so selecting an item needs no label matching
+    handlers = {
+        0: search_by_date_range,
+        1: search_by_tags_only,
+        2: search_by_content_length,
+        3: search_with_regex,
+        5: saved_searches_menu,
+        6: search_history_menu,
+    }
+    back_row = menu.index("Back")
 
+    selectable = [i for i, item in enumerate(menu) if item]
     while True:
         stdscr.clear()
         safe_addstr(stdscr, 0, 0, "🔍 Advanced Search")
@@ -1242,30 +1640,15 @@ def advanced_search_menu(stdscr):
         key = stdscr.getch()
         
         if key == curses.KEY_UP:
-            current_row = (current_row - 1) % len(menu)
-            while current_row > 0 and menu[current_row] == "":
-                current_row = (current_row - 1) % len(menu)
+            current_row = step_menu_row(selectable, current_row, -1)
         elif key == curses.KEY_DOWN:
-            current_row = (current_row + 1) % len(menu)
-            while current_row < len(menu) - 1 and menu[current_row] == "":
-                current_row = (current_row + 1) % len(menu)
+            current_row = step_menu_row(selectable, current_row, 1)
         elif is_selection_key(key):
-            selected_item = menu[current_row]
-            
-            if "Search by Date Range" in selected_item:
-                search_by_date_range(stdscr)
-            elif "Search by Tags Only" in selected_item:
-                search_by_tags_only(stdscr)
-            elif "Search by Content Length" in selected_item:
-                search_by_content_length(stdscr)
-            elif "Search with Regular Expression" in selected_item:
-                search_with_regex(stdscr)
-            elif "Saved Searches" in selected_item:
-                saved_searches_menu(stdscr)
-            elif "Search History" in selected_item:
-                search_history_menu(stdscr)
-            elif "Back" in selected_item:
+            if current_row == back_row:
                 break
+            handler = handlers.get(current_row)
+            if handler is not None:
+                handler(stdscr)
         elif key == 27:  # ESC
             break
 
@@ -1311,19 +1694,29 @@ def search_by_date_range(stdscr):
     all_entries = get_all_entries()
     filtered_entries = []
     
-    for entry in all_entries:
-        try:
-            entry_date = datetime.strptime(entry['filename'].replace('.md', ''), "%Y-%m-%d")
-            if start_dt <= entry_date <= end_dt:
-                # If search term provided, also filter by content
-                if search_term:
-                    searchable_text = f"{entry['title']} {entry['tags']} {entry['content']}".lower()
-                    if search_term.lower() in searchable_text:
-                        filtered_entries.append(entry)
-                else:
-                    filtered_entries.append(entry)
-        except ValueError:
+    # ISO dates order the same as strings, so compare canonical filenames directly
+    start_key = start_dt.date().isoformat()
+    end_key = end_dt.date().isoformat()
+    
+    search_term_lc = search_term.lower() if search_term else ""
+    
+    columns = get_entry_columns(all_entries)
+    
+    for i, (name, entry_date) in enumerate(zip(columns["names"], columns["dates"])):
+        if entry_date is None:
             continue
+        if len(name) == 10:
+            in_range = start_key <= name <= end_key
+        else:
+            in_range = start_dt <= entry_date <= end_dt
+        if in_range:
+            entry = all_entries[i]
+            # If search term provided, also filter by content
+            if search_term:
+                if entry_contains(entry, search_term_lc):
+                    filtered_entries.append(entry)
+            else:
+                filtered_entries.append(entry)
     
     display_search_results(stdscr, filtered_entries, f"Date range: {start_date} to {end_date}")
 
@@ -1352,17 +1745,44 @@ def search_by_tags_only(stdscr):
     
     # Filter entries by tags
     all_entries = get_all_entries()
-    filtered_entries = []
-    
-    for entry in all_entries:
-        if entry['tags']:
-            entry_tags = [tag.strip().lower() for tag in entry['tags'].split(',')]
-            # Check if any target tags match entry tags
-            if any(target_tag in entry_tags for target_tag in target_tags):
-                filtered_entries.append(entry)
+    filtered_entries = filter_entries_by_tags(all_entries, target_tags)
     
     display_search_results(stdscr, filtered_entries, f"Tags: {tags_input}")
 
+def _get_word_count_kernel():
+    """Compile the word-count range filter with numba if it is installed"""
+    global _WORD_COUNT_KERNEL
+    if _WORD_COUNT_KERNEL is None:
+        try:
+            # Optional dependencies - fall back to plain Python without them
+            import numpy as np
+            from numba import njit
+            
+            @njit
+            def filter_counts(counts, low, high):
+                out = np.empty(counts.size, dtype=np.int64)
+                n = 0
+                for i in range(counts.size):
+                    if low <= counts[i] <= high:
+                        out[n] = i
+                        n += 1
+                return out[:n]
+            
+            _WORD_COUNT_KERNEL = (np, filter_counts)
+        except ImportError:
+            _WORD_COUNT_KERNEL = False
+    return _WORD_COUNT_KERNEL or None
+
+def filter_entries_by_word_count(entries, min_words, max_words):
+    """Return entries whose word count lies within [min_words, max_words]"""
+    word_counts = get_entry_columns(entries)["word_counts"]
+    kernel = _get_word_count_kernel()
+    if kernel is not None and entries:
+        np, filter_counts = kernel
+        counts = np.fromiter(word_counts, dtype=np.int64, count=len(word_counts))
+        return [entries[i] for i in filter_counts(counts, float(min_words), float(max_words))]
+    return [entries[i] for i, count in enumerate(word_counts) if min_words <= count <= max_words]
+
 def search_by_content_length(stdscr):
     """Search entries by content length"""
     current_row = 0
@@ -1423,12 +1843,7 @@ def search_by_content_length(stdscr):
             
             # Filter entries by word count
             all_entries = get_all_entries()
-            filtered_entries = []
-            
-            for entry in all_entries:
-                word_count = len(entry['content'].split())
-                if min_words <= word_count <= max_words:
-                    filtered_entries.append(entry)
+            filtered_entries = filter_entries_by_word_count(all_entries, min_words, max_words)
             
             desc = length_options[current_row][1]
             display_search_results(stdscr, filtered_entries, f"Content length: {desc}")
@@ -1451,8 +1866,9 @@ def search_with_regex(stdscr):
     
     curses.noecho()
     
+    # Validate up front; regex_filter_entries picks its own flags for the scan
     try:
-        regex = re.compile(pattern, re.IGNORECASE)
+        re.compile(pattern, re.IGNORECASE)
     except re.error as e:
         safe_addstr(stdscr, 5, 0, f"Invalid regex pattern: {str(e)}")
         safe_addstr(stdscr, 6, 0, "Press any key to continue...")
@@ -1461,15 +1877,52 @@ def search_with_regex(stdscr):
     
     # Filter entries by regex
     all_entries = get_all_entries()
-    filtered_entries = []
-    
-    for entry in all_entries:
-        searchable_text = f"{entry['title']} {entry['tags']} {entry['content']}"
-        if regex.search(searchable_text):
-            filtered_entries.append(entry)
+    filtered_entries = regex_filter_entries(pattern, all_entries)
     
     display_search_results(stdscr, filtered_entries, f"Regex: {pattern}")
 
+def regex_filter_entries(pattern, entries):
+    """Return the entries whose searchable text matches pattern (case-insensitive)"""
+    if not entries:
+        return []
+    texts = [f"{entry['title']} {entry['tags']} {entry['content']}" for entry in entries]
+    
+    # Anchors and lookarounds behave differently inside a joined buffer, so test those per entry
+    if _REGEX_CONTEXT_RE.search(pattern):
+        regex = re.compile(pattern, re.IGNORECASE)
+        return [entry for entry, text in zip(entries, texts) if regex.search(text)]
+    
+    # Scan one NUL-joined buffer so the regex engine stays in C across entries
+    buffer = '\x00'.join(texts)
+    flags = re.IGNORECASE
+    if pattern.isascii() and buffer.isascii():
+        flags |= re.ASCII
+    regex = re.compile(pattern, flags)
+    
+    starts = []
+    offset = 0
+    for text in texts:
+        starts.append(offset)
+        offset += len(text) + 1
+    
+    filtered_entries = []
+    pos = 0
+    while True:
+        match = regex.search(buffer, pos)
+        if match is None:
+            break
+        idx = bisect.bisect_right(starts, match.start()) - 1
+        entry_end = starts[idx] + len(texts[idx])
+        # A match running past the entry's end may not exist in the entry alone
+        if match.end() <= entry_end or regex.search(texts[idx]):
+            filtered_entries.append(entries[idx])
+        # Continue from the next entry; it may hold a match this one overlapped
+        if idx + 1 >= len(starts):
+            break
+        pos = starts[idx + 1]
+    
+    return filtered_entries
+
 def display_search_results(stdscr, entries, search_description):
     """Display search results with common interface"""
     if not entries:
@@ -1481,44 +1934,66 @@ def display_search_results(stdscr, entries, search_description):
         stdscr.getch()
         return
     
+    height, width = stdscr.getmaxyx()
+    list_top = 4
+    visible_rows = max(1, height - list_top - 1)
     idx = 0
+    top = 0
+    
+    # Render the result list into a pad; moving the selection only repaints two rows
+    def draw_item(pad, y, i):
+        display_name = get_entry_display_name(entries[i])
+        prefix = "> " if i == idx else "  "
+        attr = curses.A_REVERSE if i == idx else 0
+        safe_addstr(pad, y, 0, f"{prefix}{display_name}", attr)
+    
+    render_row, show_rows = make_list_pad(len(entries), width, draw_item)
+    
+    redraw_needed = True
     while True:
-        stdscr.clear()
-        safe_addstr(stdscr, 0, 0, f"Search Results ({len(entries)} found)")
-        safe_addstr(stdscr, 1, 0, f"Search: {search_description}")
-        safe_addstr(stdscr, 2, 0, "Enter/Space to read, E to edit, C to copy, ESC to go back")
+        if redraw_needed:
+            stdscr.clear()
+            safe_addstr(stdscr, 0, 0, f"Search Results ({len(entries)} found)")
+            safe_addstr(stdscr, 1, 0, f"Search: {search_description}")
+            safe_addstr(stdscr, 2, 0, "Enter/Space to read, E to edit, C to copy, ESC to go back")
+            redraw_needed = False
         
         # Show preview of selected entry
-        if idx < len(entries):
-            selected_entry = entries[idx]
-            preview = selected_entry['content'][:100].replace('\n', ' ')
-            show_status_bar(stdscr, f"Preview: {preview}...")
+        selected_entry = entries[idx]
+        preview = selected_entry['content'][:100].replace('\n', ' ')
+        show_status_bar(stdscr, f"Preview: {preview}...")
         
-        for i, entry in enumerate(entries):
-            display_name = get_entry_display_name(entry)
-            prefix = "> " if i == idx else "  "
-            attr = curses.A_REVERSE if i == idx else 0
-            
-            safe_addstr(stdscr, i+4, 0, f"{prefix}{display_name}", attr)
+        # Keep the selection inside the visible window
+        if idx < top:
+            top = idx
+        elif idx >= top + visible_rows:
+            top = idx - visible_rows + 1
+        
+        stdscr.noutrefresh()
+        show_rows(top, list_top, visible_rows)
+        curses.doupdate()
         
         key = stdscr.getch()
         
-        if key == curses.KEY_UP:
-            idx = (idx - 1) % len(entries)
-        elif key == curses.KEY_DOWN:
-            idx = (idx + 1) % len(entries)
+        if key == curses.KEY_UP or key == curses.KEY_DOWN:
+            previous = idx
+            step = -1 if key == curses.KEY_UP else 1
+            idx = (idx + step) % len(entries)
+            render_row(previous)
+            render_row(idx)
         elif is_selection_key(key):
             selected_entry = entries[idx]
             display_entry_content(stdscr, selected_entry)
+            redraw_needed = True
         elif key == ord('e') or key == ord('E'):
             selected_entry = entries[idx]
             edit_entry(stdscr, selected_entry)
+            redraw_needed = True
         elif key == ord('c') or key == ord('C'):
             selected_entry = entries[idx]
             entry_text = f"# {selected_entry['title']}\n\ntags: {selected_entry['tags']}\n\n{selected_entry['content']}"
             if copy_entry_to_clipboard(entry_text):
-                show_status_bar(stdscr, "Entry copied to clipboard!")
-                time.sleep(1)
+                flash_status(stdscr, "Entry copied to clipboard!")
         elif key == 27:  # ESC
             break
 
@@ -1556,7 +2031,19 @@ def tag_management_menu(stdscr):
         "",
         "Back"
     ]
+    
+    # Dispatch on row index so selecting an item needs no label matching
+    handlers = {
+        0: view_all_tags,
+        1: rename_tag,
+        2: merge_tags_menu,
+        3: delete_unused_tags,
+        5: show_tag_statistics,
+        6: show_most_used_tags,
+    }
+    back_row = menu.index("Back")
 
+    selectable = [i for i, item in enumerate(menu) if item]
     while True:
         stdscr.clear()
         safe_addstr(stdscr, 0, 0, "🏷️  Tag Management")
@@ -1576,44 +2063,34 @@ def tag_management_menu(stdscr):
         key = stdscr.getch()
         
         if key == curses.KEY_UP:
-            current_row = (current_row - 1) % len(menu)
-            while current_row > 0 and menu[current_row] == "":
-                current_row = (current_row - 1) % len(menu)
+            current_row = step_menu_row(selectable, current_row, -1)
         elif key == curses.KEY_DOWN:
-            current_row = (current_row + 1) % len(menu)
-            while current_row < len(menu) - 1 and menu[current_row] == "":
-                current_row = (current_row + 1) % len(menu)
+            current_row = step_menu_row(selectable, current_row, 1)
         elif is_selection_key(key):
-            selected_item = menu[current_row]
-            
-            if "View All Tags" in selected_item:
-                view_all_tags(stdscr)
-            elif "Rename Tag" in selected_item:
-                rename_tag(stdscr)
-            elif "Merge Tags" in selected_item:
-                merge_tags_menu(stdscr)
-            elif "Delete Unused Tags" in selected_item:
-                delete_unused_tags(stdscr)
-            elif "Tag Statistics" in selected_item:
-                show_tag_statistics(stdscr)
-            elif "Most Used Tags" in selected_item:
-                show_most_used_tags(stdscr)
-            elif "Back" in selected_item:
+            if current_row == back_row:
                 break
+            handler = handlers.get(current_row)
+            if handler is not None:
+                handler(stdscr)
         elif key == 27:  # ESC
             break
 
 def get_all_tags():
     """Get all unique tags from all entries"""
+    global _ALL_TAGS_CACHE
     all_entries = get_all_entries()
-    tags = set()
     
+    if _ALL_TAGS_CACHE is not None and _ALL_TAGS_CACHE[0] is all_entries:
+        return list(_ALL_TAGS_CACHE[1])
+    
+    tags = set()
     for entry in all_entries:
-        if entry['tags']:
-            entry_tags = [tag.strip() for tag in entry['tags'].split(',') if tag.strip()]
-            tags.update(entry_tags)
+        if entry['_tags']:
+            tags.update(entry['_tags'])
     
-    return sorted(list(tags))
+    sorted_tags = sorted(tags)
+    _ALL_TAGS_CACHE = (all_entries, sorted_tags)
+    return list(sorted_tags)
 
 def view_all_tags(stdscr):
     """Display all tags in the journal"""
@@ -1629,25 +2106,29 @@ def view_all_tags(stdscr):
     height, width = stdscr.getmaxyx()
     start_line = 0
     content_height = height - 4
+    max_start = max(0, len(all_tags) - content_height)
+    
+    # Render the tags into a pad; scrolling mostly just changes which pad rows are shown
+    def draw_item(pad, y, i):
+        safe_addstr(pad, y, 2, f"• {all_tags[i]}")
+    
+    _, show_rows = make_list_pad(len(all_tags), width, draw_item)
+    
+    stdscr.clear()
+    safe_addstr(stdscr, 0, 0, f"All Tags ({len(all_tags)} total)")
+    safe_addstr(stdscr, 1, 0, "↑/↓ to scroll, ESC to go back")
     
     while True:
-        stdscr.clear()
-        safe_addstr(stdscr, 0, 0, f"All Tags ({len(all_tags)} total)")
-        safe_addstr(stdscr, 1, 0, "↑/↓ to scroll, ESC to go back")
-        
-        # Display visible tags
-        for i in range(content_height):
-            if start_line + i < len(all_tags):
-                tag = all_tags[start_line + i]
-                safe_addstr(stdscr, i + 3, 2, f"• {tag}")
-        
         # Show scroll indicators
-        if start_line > 0:
-            safe_addstr(stdscr, 2, width - 3, "↑")
+        safe_addstr(stdscr, 2, width - 3, "↑" if start_line > 0 else " ")
+        show_status_bar(stdscr, f"Tag {start_line + 1}-{min(start_line + content_height, len(all_tags))} of {len(all_tags)}")
         if start_line + content_height < len(all_tags):
             safe_addstr(stdscr, height - 1, width - 3, "↓")
         
-        show_status_bar(stdscr, f"Tag {start_line + 1}-{min(start_line + content_height, len(all_tags))} of {len(all_tags)}")
+        stdscr.noutrefresh()
+        if content_height > 0:
+            show_rows(start_line, 3, content_height)
+        curses.doupdate()
         
         key = stdscr.getch()
         
@@ -1658,7 +2139,7 @@ def view_all_tags(stdscr):
         elif key == curses.KEY_PPAGE:
             start_line = max(0, start_line - content_height)
         elif key == curses.KEY_NPAGE:
-            start_line = min(len(all_tags) - content_height, start_line + content_height)
+            start_line = min(max_start, start_line + content_height)
         elif key == 27:  # ESC
             break
 
@@ -1692,16 +2173,25 @@ def delete_unused_tags(stdscr):
     safe_addstr(stdscr, 6, 0, "Press any key to continue...")
     stdscr.getch()
 
+def _compute_tag_counts(entries):
+    """Count tag uses across entries; returns (counts, items sorted by count)"""
+    tag_counts = Counter()
+    for entry in entries:
+        if entry['_tags']:
+            tag_counts.update(entry['_tags'])
+    return tag_counts, tag_counts.most_common()
+
+def get_tag_counts(entries):
+    """Get (tag counts, tags sorted by usage), cached until the entries change"""
+    global _TAG_COUNT_CACHE
+    if _TAG_COUNT_CACHE is None or _TAG_COUNT_CACHE[0] is not entries:
+        _TAG_COUNT_CACHE = (entries, *_compute_tag_counts(entries))
+    return _TAG_COUNT_CACHE[1], _TAG_COUNT_CACHE[2]
+
 def show_tag_statistics(stdscr):
     """Show statistics about tag usage"""
     all_entries = get_all_entries()
-    tag_counts = {}
-    
-    for entry in all_entries:
-        if entry['tags']:
-            entry_tags = [tag.strip() for tag in entry['tags'].split(',') if tag.strip()]
-            for tag in entry_tags:
-                tag_counts[tag] = tag_counts.get(tag, 0) + 1
+    tag_counts, sorted_tags = get_tag_counts(all_entries)
     
     if not tag_counts:
         stdscr.clear()
@@ -1722,11 +2212,10 @@ def show_tag_statistics(stdscr):
     y_pos += 2
     
     # Show top 10 most used tags
-    sorted_tags = sorted(tag_counts.items(), key=lambda x: x[1], reverse=True)[:10]
     safe_addstr(stdscr, y_pos, 0, "Top 10 Most Used Tags:")
     y_pos += 1
     
-    for i, (tag, count) in enumerate(sorted_tags):
+    for i, (tag, count) in enumerate(sorted_tags[:10]):
         safe_addstr(stdscr, y_pos, 2, f"{i+1}. {tag} ({count} uses)")
         y_pos += 1
     
@@ -1736,13 +2225,7 @@ def show_tag_statistics(stdscr):
 def show_most_used_tags(stdscr):
     """Show most frequently used tags"""
     all_entries = get_all_entries()
-    tag_counts = {}
-    
-    for entry in all_entries:
-        if entry['tags']:
-            entry_tags = [tag.strip() for tag in entry['tags'].split(',') if tag.strip()]
-            for tag in entry_tags:
-                tag_counts[tag] = tag_counts.get(tag, 0) + 1
+    tag_counts, sorted_tags = get_tag_counts(all_entries)
     
     if not tag_counts:
         stdscr.clear()
@@ -1751,47 +2234,93 @@ def show_most_used_tags(stdscr):
         stdscr.getch()
         return
     
-    # Sort by usage count
-    sorted_tags = sorted(tag_counts.items(), key=lambda x: x[1], reverse=True)
-    
     height, width = stdscr.getmaxyx()
     start_line = 0
     content_height = height - 4
     
-    while True:
-        stdscr.clear()
-        safe_addstr(stdscr, 0, 0, f"Most Used Tags ({len(sorted_tags)} total)")
-        safe_addstr(stdscr, 1, 0, "↑/↓ to scroll, ESC to go back")
-        
-        # Display visible tags
-        for i in range(content_height):
-            if start_line + i < len(sorted_tags):
-                tag, count = sorted_tags[start_line + i]
-                safe_addstr(stdscr, i + 3, 2, f"{start_line + i + 1}. {tag} ({count} uses)")
-        
-        # Show scroll indicators
-        if start_line > 0:
-            safe_addstr(stdscr, 2, width - 3, "↑")
-        if start_line + content_height < len(sorted_tags):
-            safe_addstr(stdscr, height - 1, width - 3, "↓")
-        
-        show_status_bar(stdscr, f"Tag {start_line + 1}-{min(start_line + content_height, len(sorted_tags))} of {len(sorted_tags)}")
-        
-        key = stdscr.getch()
-        
-        if key == curses.KEY_UP and start_line > 0:
-            start_line -= 1
-        elif key == curses.KEY_DOWN and start_line + content_height < len(sorted_tags):
-            start_line += 1
-        elif key == curses.KEY_PPAGE:
-            start_line = max(0, start_line - content_height)
-        elif key == curses.KEY_NPAGE:
-            start_line = min(len(sorted_tags) - content_height, start_line + content_height)
-        elif key == 27:  # ESC
-            break
+    # The ranking is fixed while this view is open, so format every row once
+    labels = [f"{i + 1}. {tag} ({count} uses)" for i, (tag, count) in enumerate(sorted_tags)]
+    
+    def draw_row(row):
+        """Draw one row of the tag list, clearing whatever was there"""
+        i = start_line + row
+        stdscr.move(row + 3, 0)
+        stdscr.clrtoeol()
+        if i < len(labels):
+            safe_addstr(stdscr, row + 3, 2, labels[i])
+    
+    # Single-line moves scroll the list region and draw only the exposed row
+    can_scroll = content_height > 1
+    if can_scroll:
+        stdscr.setscrreg(3, 3 + content_height - 1)
+    
+    full_redraw = True
+    try:
+        while True:
+            if full_redraw:
+                stdscr.clear()
+                safe_addstr(stdscr, 0, 0, f"Most Used Tags ({len(sorted_tags)} total)")
+                safe_addstr(stdscr, 1, 0, "↑/↓ to scroll, ESC to go back")
+                for row in range(content_height):
+                    draw_row(row)
+                full_redraw = False
+            
+            # Show scroll indicators
+            safe_addstr(stdscr, 2, width - 3, "↑" if start_line > 0 else " ")
+            show_status_bar(stdscr, f"Tag {start_line + 1}-{min(start_line + content_height, len(sorted_tags))} of {len(sorted_tags)}")
+            if start_line + content_height < len(sorted_tags):
+                safe_addstr(stdscr, height - 1, width - 3, "↓")
+            
+            key = stdscr.getch()
+            
+            if key == curses.KEY_UP and start_line > 0:
+                start_line -= 1
+                if can_scroll:
+                    stdscr.scrollok(True)
+                    stdscr.scroll(-1)
+                    stdscr.scrollok(False)
+                    draw_row(0)
+                else:
+                    full_redraw = True
+            elif key == curses.KEY_DOWN and start_line + content_height < len(sorted_tags):
+                start_line += 1
+                if can_scroll:
+                    stdscr.scrollok(True)
+                    stdscr.scroll(1)
+                    stdscr.scrollok(False)
+                    draw_row(content_height - 1)
+                else:
+                    full_redraw = True
+            elif key == curses.KEY_PPAGE:
+                start_line = max(0, start_line - content_height)
+                full_redraw = True
+            elif key == curses.KEY_NPAGE:
+                start_line = min(max(0, len(sorted_tags) - content_height), start_line + content_height)
+                full_redraw = True
+            elif key == 27:  # ESC
+                break
+    finally:
+        if can_scroll:
+            stdscr.setscrreg(0, height - 1)
 
 # ================== END ADVANCED SEARCH & TAG MANAGEMENT ==================
 
+def _tag_pattern(tag_prefixes):
+    """Build a pattern capturing the text after a tag prefix at the start of a word"""
+    alternatives = '|'.join(re.escape(prefix) for prefix in tag_prefixes)
+    # The lazy group leaves trailing punctuation to the class, matching rstrip('.,;:!?')
+    return rf'(?<!\S)(?:{alternatives})(\S*?)[.,;:!?]*(?!\S)'
+
+@functools.lru_cache(maxsize=8)
+def _tag_regex(tag_prefixes):
+    """Compile the tag pattern for str content"""
+    return re.compile(_tag_pattern(tag_prefixes))
+
+@functools.lru_cache(maxsize=8)
+def _tag_regex_bytes(tag_prefixes):
+    """Compile the tag pattern for ASCII content encoded as bytes"""
+    return re.compile(_tag_pattern(tag_prefixes).encode('utf-8'))
+
 def extract_tags_from_content(content, tag_prefixes=None):
     """Extract tags from content using specified prefixes"""
     if not content:
@@ -1800,26 +2329,27 @@ def extract_tags_from_content(content, tag_prefixes=None):
         settings = get_settings()
         tag_prefixes = settings.get("tag_prefixes", ["#", "@"])
     
-    tags = set()
-    lines = content.split('\n')
+    if not tag_prefixes:
+        return []
+    # Untagged content is common; a substring scan rules it out without the regex
+    if not any(prefix in content for prefix in tag_prefixes):
+        return []
     
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        # Split line into words and check each word
-        words = line.split()
-        for word in words:
-            for prefix in tag_prefixes:
-                if word.startswith(prefix):
-                    # Extract the tag (remove prefix and any trailing punctuation)
-                    tag = word[len(prefix):]
-                    # Remove common punctuation that might follow the tag
-                    tag = tag.rstrip('.,;:!?')
-                    # Only add if it's a valid tag (not empty and contains at least one alphanumeric character)
-                    if tag and any(c.isalnum() for c in tag):
-                        tags.add(tag.lower())
-                    break  # Only match one prefix per word
+    # One regex pass replaces splitting into lines and words; alternation order
+    # matches the old first-prefix-wins loop
+    tags = set()
+    tag_prefixes = tuple(tag_prefixes)
+    # Plain ASCII text is scanned as bytes, which skips the Unicode class lookups
+    if content.isascii() and not _INFO_SEPARATOR_RE.search(content):
+        for tag in set(_tag_regex_bytes(tag_prefixes).findall(content.encode('ascii'))):
+            if tag.strip(_ASCII_NON_ALNUM):
+                tags.add(tag.lower().decode('ascii'))
+        return sorted(list(tags))
+    
+    for tag in set(_tag_regex(tag_prefixes).findall(content)):
+        # Only add if it's a valid tag (not empty and contains at least one alphanumeric character)
+        if any(c.isalnum() for c in tag):
+            tags.add(tag.lower())
     return sorted(list(tags))
 
 def merge_tags(existing_tags, detected_tags):
@@ -1832,25 +2362,18 @@ def merge_tags(existing_tags, detected_tags):
     # Parse existing tags
     existing_tag_list = [tag.strip().lower() for tag in existing_tags.split(',') if tag.strip()]
     
-    # Combine and deduplicate
-    all_tags = existing_tag_list + detected_tags
-    unique_tags = []
-    seen = set()
-    
-    for tag in all_tags:
-        if tag not in seen:
-            unique_tags.append(tag)
-            seen.add(tag)
+    # Combine and deduplicate, keeping first-seen order
+    unique_tags = dict.fromkeys(existing_tag_list)
+    unique_tags.update(dict.fromkeys(detected_tags))
     
     return ", ".join(unique_tags)
 
-def get_entry_templates():
-    """Get available entry templates"""
-    return {
-        "daily_reflection": {
-            "title": "Daily Reflection",
-            "tags": "reflection, personal",
-            "content": """What went well today?
+# Built-in entry templates (read-only, shared by every caller)
+_ENTRY_TEMPLATES = MappingProxyType({
+    "daily_reflection": {
+        "title": "Daily Reflection",
+        "tags": "reflection, personal",
+        "content": """What went well today?
 
 
 What could have gone better?
@@ -1863,11 +2386,11 @@ Goals for tomorrow:
 - 
 - 
 - """
-        },
-        "meeting_notes": {
-            "title": "Meeting Notes",
-            "tags": "work, meeting",
-            "content": """Meeting: 
+    },
+    "meeting_notes": {
+        "title": "Meeting Notes",
+        "tags": "work, meeting",
+        "content": """Meeting: 
 Date: 
 Attendees: 
 
@@ -1885,11 +2408,11 @@ Action Items:
 
 Next Steps:
 - """
-        },
-        "idea_capture": {
-            "title": "Idea",
-            "tags": "ideas, brainstorm",
-            "content": """Idea: 
+    },
+    "idea_capture": {
+        "title": "Idea",
+        "tags": "ideas, brainstorm",
+        "content": """Idea: 
 
 Context:
 
@@ -1903,11 +2426,11 @@ Potential next steps:
 
 Related thoughts:
 - """
-        },
-        "goal_setting": {
-            "title": "Goal Setting",
-            "tags": "goals, planning",
-            "content": """Goal: 
+    },
+    "goal_setting": {
+        "title": "Goal Setting",
+        "tags": "goals, planning",
+        "content": """Goal: 
 
 Why is this important?
 
@@ -1928,11 +2451,11 @@ Resources needed:
 Potential obstacles:
 - 
 - """
-        },
-        "learning_log": {
-            "title": "Learning Log",
-            "tags": "learning, education",
-            "content": """What I learned: 
+    },
+    "learning_log": {
+        "title": "Learning Log",
+        "tags": "learning, education",
+        "content": """What I learned: 
 
 Source: 
 
@@ -1946,11 +2469,11 @@ How I can apply this:
 Questions for further exploration:
 - 
 - """
-        },
-        "gratitude": {
-            "title": "Gratitude Entry",
-            "tags": "gratitude, mindfulness",
-            "content": """Three things I'm grateful for today:
+    },
+    "gratitude": {
+        "title": "Gratitude Entry",
+        "tags": "gratitude, mindfulness",
+        "content": """Three things I'm grateful for today:
 
 1. 
 
@@ -1963,14 +2486,23 @@ Why these matter to me:
 
 How I can express gratitude:
 - """
-        }
     }
+})
+_TEMPLATE_KEYS = tuple(_ENTRY_TEMPLATES)
+# Menu rows and status-bar previews for select_template, ending with the blank option
+_TEMPLATE_LABELS = tuple(f"{template['title']} (tags: {template['tags']})"
+                         for template in _ENTRY_TEMPLATES.values()) + ("Blank Entry (no template)",)
+_TEMPLATE_PREVIEWS = tuple("Preview: " + ' '.join(template['content'].split('\n')[:5]).strip()[:100] + "..."
+                           for template in _ENTRY_TEMPLATES.values())
+
+def get_entry_templates():
+    """Get available entry templates"""
+    return _ENTRY_TEMPLATES
 
 def select_template(stdscr):
     """Select an entry template"""
     templates = get_entry_templates()
-    template_keys = list(templates.keys())
-    template_names = [templates[key]["title"] for key in template_keys]
+    template_keys = _TEMPLATE_KEYS
     
     current_row = 0
     
@@ -1981,23 +2513,14 @@ def select_template(stdscr):
         
         # Show template preview
         if current_row < len(template_keys):
-            selected_template = templates[template_keys[current_row]]
-            preview_lines = selected_template["content"].split('\n')[:5]
-            show_status_bar(stdscr, f"Preview: {' '.join(preview_lines).strip()[:100]}...")
-        
-        for i, (key, name) in enumerate(zip(template_keys, template_names)):
-            prefix = "> " if i == current_row else "  "
-            attr = curses.A_REVERSE if i == current_row else 0
-            
-            # Show template info
-            template_info = f"{name} (tags: {templates[key]['tags']})"
-            safe_addstr(stdscr, i+3, 2, f"{prefix}{template_info}", attr)
+            show_status_bar(stdscr, _TEMPLATE_PREVIEWS[current_row])
         
-        # Add option for blank entry
-        blank_row = len(template_keys)
-        prefix = "> " if current_row == blank_row else "  "
-        attr = curses.A_REVERSE if current_row == blank_row else 0
-        safe_addstr(stdscr, blank_row+3, 2, f"{prefix}Blank Entry (no template)", attr)
+        # Template rows followed by the blank entry option
+        for i, label in enumerate(_TEMPLATE_LABELS):
+            if i == current_row:
+                safe_addstr(stdscr, i+3, 2, "> " + label, curses.A_REVERSE)
+            else:
+                safe_addstr(stdscr, i+3, 2, "  " + label)
         
         key = stdscr.getch()
         
@@ -2013,52 +2536,51 @@ def select_template(stdscr):
         elif key == 27:  # ESC
             return None  # Blank entry
 
+# Help overlay text and its widest line, built once
+_HELP_TEXT = (
+    f"Keyboard Shortcuts ({_PLATFORM_NAME})",
+    "",
+    "Main Menu:",
+    "  Ctrl+N - New Blank Entry (Terminal)",
+    "  Ctrl+T - New Entry with Template",
+    "  Ctrl+O - Edit Today's Journal",
+    "  Ctrl+F - Search Entries",
+    "  Ctrl+B - Create Backup",
+    "  Ctrl+S - Settings",
+    "  Ctrl+H - This Help",
+    "",
+    "Navigation:",
+    "  ↑/↓ - Move up/down",
+    "  Enter/Space - Select",
+    "  ESC - Go back/Cancel",
+    "",
+    "Editing:",
+    "  Ctrl+S - Save",
+    "  Ctrl+Q - Quit without saving",
+    "  Ctrl+A/E - Line start/end",
+    "  Ctrl+W/X - Word navigation",
+    "",
+    "File Operations:",
+    "  Ctrl+C - Copy entry",
+    "  Ctrl+D - Delete entry",
+    "",
+    "Platform Notes:",
+    f"  Using {_PLATFORM_NAME} shortcuts",
+    "  Cmd+Q is reserved by macOS",
+    "  Use Ctrl+Q to quit editors",
+    "",
+    "Press any key to close..."
+)
+_HELP_MAXLEN = max(len(line) for line in _HELP_TEXT)
+
 def show_help_overlay(stdscr):
     """Show keyboard shortcuts help overlay"""
     height, width = stdscr.getmaxyx()
-    
-    # Get platform-specific shortcuts
-    shortcuts = get_platform_shortcuts()
-    platform_name = "Mac" if platform.system() == "Darwin" else "Linux/Windows"
-    
-    help_text = [
-        f"Keyboard Shortcuts ({platform_name})",
-        "",
-        "Main Menu:",
-        "  Ctrl+N - New Blank Entry (Terminal)",
-        "  Ctrl+T - New Entry with Template",
-        "  Ctrl+O - Edit Today's Journal",
-        "  Ctrl+F - Search Entries",
-        "  Ctrl+B - Create Backup",
-        "  Ctrl+S - Settings",
-        "  Ctrl+H - This Help",
-        "",
-        "Navigation:",
-        "  ↑/↓ - Move up/down",
-        "  Enter/Space - Select",
-        "  ESC - Go back/Cancel",
-        "",
-        "Editing:",
-        "  Ctrl+S - Save",
-        "  Ctrl+Q - Quit without saving",
-        "  Ctrl+A/E - Line start/end",
-        "  Ctrl+W/X - Word navigation",
-        "",
-        "File Operations:",
-        "  Ctrl+C - Copy entry",
-        "  Ctrl+D - Delete entry",
-        "",
-        "Platform Notes:",
-        f"  Using {platform_name} shortcuts",
-        "  Cmd+Q is reserved by macOS",
-        "  Use Ctrl+Q to quit editors",
-        "",
-        "Press any key to close..."
-    ]
+    help_text = _HELP_TEXT
     
     # Create help window
     help_height = min(len(help_text) + 4, height - 4)
-    help_width = min(max(len(line) for line in help_text) + 4, width - 4)
+    help_width = min(_HELP_MAXLEN + 4, width - 4)
     
     start_y = (height - help_height) // 2
     start_x = (width - help_width) // 2
@@ -2088,11 +2610,12 @@ def write_in_terminal(stdscr, title, tags):
     show_status_bar(stdscr, "Writing mode - Ctrl+D to finish")
     
     content_lines = []
-    current_line = ""
+    line_buf = []  # characters of the line being typed
+    word_count = 0
     y_pos = 3
     cursor_col = 0
     
-    def redraw_current_line():
+    def redraw_current_line(from_col=0):
         nonlocal y_pos, cursor_col
         try:
             height, width = stdscr.getmaxyx()
@@ -2126,13 +2649,13 @@ def write_in_terminal(stdscr, title, tags):
             stdscr.move(y_pos, cursor_col)
             stdscr.refresh()
             
-            stdscr.move(y_pos, cursor_col)
+            # Only the tail from the edit position has changed
+            stdscr.move(y_pos, from_col)
             stdscr.clrtoeol()
-            safe_addstr(stdscr, y_pos, 0, current_line)
+            safe_addstr(stdscr, y_pos, from_col, ''.join(line_buf[from_col:]))
             stdscr.move(y_pos, cursor_col)
             
             # Update status bar with word count
-            word_count = get_word_count('\n'.join(content_lines + [current_line]))
             show_status_bar(stdscr, f"Words: {word_count} | Ctrl+D to finish | Ctrl+H for help")
             stdscr.refresh()
         except curses.error:
@@ -2166,8 +2689,8 @@ def write_in_terminal(stdscr, title, tags):
             char = stdscr.getch()
             
             if char == 4:  # Ctrl+D
-                if current_line:
-                    content_lines.append(current_line)
+                if line_buf:
+                    content_lines.append(''.join(line_buf))
                 break
             elif char == 8:  # Ctrl+H - Help
                 show_help_overlay(stdscr)
@@ -2181,20 +2704,22 @@ def write_in_terminal(stdscr, title, tags):
                 y_pos = 3 + len(content_lines)
                 redraw_current_line()
             elif is_enter_key(char):
-                content_lines.append(current_line)
-                current_line = ""
+                content_lines.append(''.join(line_buf))
+                line_buf = []
                 y_pos += 1
                 cursor_col = 0
                 redraw_current_line()
             elif char == 127 or char == 8:  # Backspace
                 if cursor_col > 0:
                     cursor_col -= 1
-                    current_line = current_line[:cursor_col] + current_line[cursor_col+1:]
-                    redraw_current_line()
+                    removed = line_buf.pop(cursor_col)
+                    word_count -= _word_count_delta(line_buf, cursor_col, removed)
+                    redraw_current_line(cursor_col)
             elif char == curses.KEY_DC or char == 330:  # Delete key
-                if cursor_col < len(current_line):
-                    current_line = current_line[:cursor_col] + current_line[cursor_col+1:]
-                    redraw_current_line()
+                if cursor_col < len(line_buf):
+                    removed = line_buf.pop(cursor_col)
+                    word_count -= _word_count_delta(line_buf, cursor_col, removed)
+                    redraw_current_line(cursor_col)
             elif char == curses.KEY_LEFT:
                 if cursor_col > 0:
                     cursor_col -= 1
@@ -2204,7 +2729,7 @@ def write_in_terminal(stdscr, title, tags):
                         stdscr.move(y_pos, cursor_col)
                         stdscr.refresh()
             elif char == curses.KEY_RIGHT:
-                if cursor_col < len(current_line):
+                if cursor_col < len(line_buf):
                     cursor_col += 1
                     # Ensure cursor position is valid
                     height, width = stdscr.getmaxyx()
@@ -2213,9 +2738,11 @@ def write_in_terminal(stdscr, title, tags):
                         stdscr.refresh()
             else:
                 if 32 <= char <= 126:
-                    current_line = current_line[:cursor_col] + chr(char) + current_line[cursor_col:]
+                    ch = chr(char)
+                    word_count += _word_count_delta(line_buf, cursor_col, ch)
+                    line_buf.insert(cursor_col, ch)
                     cursor_col += 1
-                    redraw_current_line()
+                    redraw_current_line(cursor_col - 1)
                     
         except KeyboardInterrupt:
             break
@@ -2226,6 +2753,7 @@ def write_in_terminal(stdscr, title, tags):
 def new_entry_with_template(stdscr, use_editor=False):
     """Create a new journal entry with optional template"""
     ensure_directories()
+    settings = get_settings()
     
     # First, let user choose a template
     template = select_template(stdscr)
@@ -2264,7 +2792,6 @@ def new_entry_with_template(stdscr, use_editor=False):
     # Get content from user or external editor
     if use_editor:
         # Use external editor
-        settings = get_settings()
         editor = settings.get("default_editor", "nano")
         
         # Create temporary file for editing
@@ -2304,16 +2831,16 @@ def new_entry_with_template(stdscr, use_editor=False):
             return
     
     # Process tags - only use explicitly entered tags, not auto-detected ones
-    settings = get_settings()
     final_tags = tags  # Only use tags from the input field
     
     if settings.get("auto_detect_tags", True) and content:
-        detected_tags = extract_tags_from_content(content)
+        word_count = get_word_count(content)
+        detected_tags = extract_tags_from_content(content, settings.get("tag_prefixes", ["#", "@"]))
         if detected_tags:
             # Show tag detection feedback but don't add them to final_tags
             stdscr.clear()
             stdscr.addstr(0, 0, f"Entry added to: {today_file}")
-            stdscr.addstr(1, 0, f"Words: {get_word_count(content)}")
+            stdscr.addstr(1, 0, f"Words: {word_count}")
             
             if detected_tags:
                 stdscr.addstr(2, 0, f"Auto-detected tags in content: {', '.join(detected_tags)}")
@@ -2327,7 +2854,7 @@ def new_entry_with_template(stdscr, use_editor=False):
             # Show that no tags were detected
             stdscr.clear()
             stdscr.addstr(0, 0, f"Entry added to: {today_file}")
-            stdscr.addstr(1, 0, f"Words: {get_word_count(content)}")
+            stdscr.addstr(1, 0, f"Words: {word_count}")
             stdscr.addstr(2, 0, "No tags detected in content")
             stdscr.addstr(3, 0, f"Explicitly entered tags: {tags}")
             stdscr.addstr(4, 0, f"Tags will appear at bottom: {final_tags}")
@@ -2346,7 +2873,7 @@ def new_entry_with_template(stdscr, use_editor=False):
     append_to_daily_file(today_file, entry_content)
     
     # Show success message
-    stats = get_file_stats(os.path.join(get_settings()["journal_directory"], today_file))
+    stats = get_file_stats(os.path.join(settings["journal_directory"], today_file))
     stdscr.clear()
     stdscr.addstr(0, 0, f"✅ Entry added to: {today_file}")
     stdscr.addstr(1, 0, f"📊 File stats: {stats['entries']} entries, {stats['words']} words")
@@ -2364,13 +2891,19 @@ def write_in_terminal_with_prefill(stdscr, title, tags, prefill_content):
     stdscr.addstr(0, 0, f"Writing: {title}")
     stdscr.addstr(1, 0, "Edit template content (Ctrl+D when finished, Ctrl+H for help):")
     
-    # Initialize with template content
-    content_lines = prefill_content.split('\n') if prefill_content else [""]
-    current_line_idx = len(content_lines) - 1
-    current_line = content_lines[current_line_idx] if content_lines else ""
-    cursor_col = len(current_line)
+    # Initialize with template content; each line is a list of characters.
+    # Lines before the cursor sit on the above stack and lines after it on the
+    # below stack (nearest last), so splitting, joining and moving are O(1).
+    above = [list(line) for line in prefill_content.split('\n')] if prefill_content else [[]]
+    current = above.pop()
+    below = []
+    cursor_col = len(current)
+    word_count = get_word_count(prefill_content) if prefill_content else 0
     y_start = 3
     
+    def status_text():
+        return f"Words: {word_count} | Line {len(above) + 1}/{len(above) + len(below) + 1} | Ctrl+D to finish"
+    
     def redraw_content():
         try:
             # Clear content area
@@ -2379,13 +2912,14 @@ def write_in_terminal_with_prefill(stdscr, title, tags, prefill_content):
                     stdscr.move(i, 0)
                     stdscr.clrtoeol()
             
-            # Draw all content lines
-            for i, line in enumerate(content_lines):
-                if y_start + i < height - 2:
-                    safe_addstr(stdscr, y_start + i, 0, line[:width-1])
+            # Draw the content lines that fit on screen
+            for i, line in enumerate(itertools.chain(above, (current,), reversed(below))):
+                if y_start + i >= height - 2:
+                    break
+                safe_addstr(stdscr, y_start + i, 0, ''.join(line[:width-1]))
             
             # Position cursor with bounds checking
-            cursor_y = y_start + current_line_idx
+            cursor_y = y_start + len(above)
             if cursor_y >= height - 1:
                 cursor_y = height - 2
             if cursor_y < y_start:
@@ -2397,9 +2931,24 @@ def write_in_terminal_with_prefill(stdscr, title, tags, prefill_content):
             
             stdscr.move(cursor_y, safe_cursor_col)
             
-            # Update status bar
-            word_count = get_word_count('\n'.join(content_lines))
-            show_status_bar(stdscr, f"Words: {word_count} | Line {current_line_idx + 1}/{len(content_lines)} | Ctrl+D to finish")
+            show_status_bar(stdscr, status_text())
+            stdscr.refresh()
+        except curses.error:
+            pass
+    
+    def redraw_line(from_col):
+        """Redraw the current line from from_col onwards after an in-line edit"""
+        cursor_y = y_start + len(above)
+        if cursor_y >= height - 2:
+            redraw_content()
+            return
+        try:
+            if from_col < width - 1:
+                stdscr.move(cursor_y, from_col)
+                stdscr.clrtoeol()
+                safe_addstr(stdscr, cursor_y, from_col, ''.join(current[from_col:width-1]))
+            stdscr.move(cursor_y, max(0, min(cursor_col, width-1)))
+            show_status_bar(stdscr, status_text())
             stdscr.refresh()
         except curses.error:
             pass
@@ -2420,79 +2969,74 @@ def write_in_terminal_with_prefill(stdscr, title, tags, prefill_content):
                 redraw_content()
             elif is_enter_key(char):
                 # Split current line
-                if current_line_idx < len(content_lines):
-                    line = content_lines[current_line_idx]
-                    content_lines[current_line_idx] = line[:cursor_col]
-                    content_lines.insert(current_line_idx + 1, line[cursor_col:])
-                else:
-                    content_lines.append("")
-                
-                current_line_idx += 1
+                word_count += _word_count_delta(current, cursor_col, '\n')
+                above.append(current[:cursor_col])
+                current = current[cursor_col:]
                 cursor_col = 0
                 redraw_content()
             elif char == 127 or char == 8:  # Backspace
                 if cursor_col > 0:
-                    line = content_lines[current_line_idx]
-                    content_lines[current_line_idx] = line[:cursor_col-1] + line[cursor_col:]
                     cursor_col -= 1
-                    redraw_content()
-                elif current_line_idx > 0:
+                    removed = current.pop(cursor_col)
+                    word_count -= _word_count_delta(current, cursor_col, removed)
+                    redraw_line(cursor_col)
+                elif above:
                     # Merge with previous line
-                    prev_line = content_lines[current_line_idx - 1]
-                    current_line = content_lines[current_line_idx]
-                    content_lines[current_line_idx - 1] = prev_line + current_line
-                    del content_lines[current_line_idx]
-                    current_line_idx -= 1
+                    prev_line = above.pop()
                     cursor_col = len(prev_line)
+                    prev_line.extend(current)
+                    current = prev_line
+                    word_count -= _word_count_delta(current, cursor_col, '\n')
                     redraw_content()
             elif char == curses.KEY_DC or char == 330:  # Delete key
-                line = content_lines[current_line_idx]
-                if cursor_col < len(line):
-                    content_lines[current_line_idx] = line[:cursor_col] + line[cursor_col+1:]
-                    redraw_content()
-                elif current_line_idx < len(content_lines) - 1:
+                if cursor_col < len(current):
+                    removed = current.pop(cursor_col)
+                    word_count -= _word_count_delta(current, cursor_col, removed)
+                    redraw_line(cursor_col)
+                elif below:
                     # At end of line, merge with next line
-                    content_lines[current_line_idx] = line + content_lines[current_line_idx + 1]
-                    del content_lines[current_line_idx + 1]
+                    current.extend(below.pop())
+                    word_count -= _word_count_delta(current, cursor_col, '\n')
                     redraw_content()
             elif char == curses.KEY_UP:
-                if current_line_idx > 0:
-                    current_line_idx -= 1
-                    cursor_col = min(cursor_col, len(content_lines[current_line_idx]))
+                if above:
+                    below.append(current)
+                    current = above.pop()
+                    cursor_col = min(cursor_col, len(current))
                     redraw_content()
             elif char == curses.KEY_DOWN:
-                if current_line_idx < len(content_lines) - 1:
-                    current_line_idx += 1
-                    cursor_col = min(cursor_col, len(content_lines[current_line_idx]))
+                if below:
+                    above.append(current)
+                    current = below.pop()
+                    cursor_col = min(cursor_col, len(current))
                     redraw_content()
             elif char == curses.KEY_LEFT:
                 if cursor_col > 0:
                     cursor_col -= 1
                     redraw_content()
             elif char == curses.KEY_RIGHT:
-                if cursor_col < len(content_lines[current_line_idx]):
+                if cursor_col < len(current):
                     cursor_col += 1
                     redraw_content()
             else:
                 if 32 <= char <= 126:
-                    line = content_lines[current_line_idx]
-                    content_lines[current_line_idx] = line[:cursor_col] + chr(char) + line[cursor_col:]
+                    ch = chr(char)
+                    word_count += _word_count_delta(current, cursor_col, ch)
+                    current.insert(cursor_col, ch)
                     cursor_col += 1
-                    redraw_content()
+                    redraw_line(cursor_col - 1)
                     
         except KeyboardInterrupt:
             break
     
     curses.curs_set(0)
-    return "\n".join(content_lines)
+    return "\n".join(''.join(line) for line in itertools.chain(above, (current,), reversed(below)))
 
 def display_daily_content(stdscr, filename, content):
     """Display daily journal content with enhanced features"""
     height, width = stdscr.getmaxyx()
     stdscr.keypad(True)
     
-    lines = content.split('\n')
-    
     if not content.strip():
         stdscr.clear()
         stdscr.addstr(0, 0, f"File: {filename}")
@@ -2509,6 +3053,24 @@ def display_daily_content(stdscr, filename, content):
     content_win.addstr(0, 2, f" {filename} ")
     content_win.keypad(True)
     
+    # Lines are sliced out of content on demand rather than split up front, so a
+    # huge file costs only the offsets of the lines scrolled past so far
+    clip_width = content_width - 2
+    line_total = content.count('\n') + 1
+    line_starts = [0]
+    
+    def visible_line(line_idx):
+        while len(line_starts) <= line_idx:
+            line_starts.append(content.find('\n', line_starts[-1]) + 1)
+        start = line_starts[line_idx]
+        end = content.find('\n', start, start + clip_width + 1)
+        if end == -1:
+            end = min(len(content), start + clip_width + 1)
+        line = content[start:end]
+        if len(line) <= clip_width:
+            return line
+        return line[:content_width - 5] + "..."
+    
     start_line = 0
     
     # Get file stats
@@ -2516,29 +3078,28 @@ def display_daily_content(stdscr, filename, content):
     stats = get_file_stats(filepath)
     
     while True:
-        content_win.clear()
+        # erase() rather than clear() so curses only sends the cells a scroll changed
+        content_win.erase()
         content_win.box()
         content_win.addstr(0, 2, f" {filename} ")
         
         # Display visible lines
         for i in range(content_height - 2):
-            if start_line + i < len(lines):
-                line = lines[start_line + i]
-                if len(line) > content_width - 2:
-                    line = line[:content_width - 5] + "..."
-                content_win.addstr(i + 1, 1, line)
+            if start_line + i < line_total:
+                content_win.addstr(i + 1, 1, visible_line(start_line + i))
         
         # Show scroll indicators
         if start_line > 0:
             content_win.addstr(1, content_width - 3, "↑")
-        if start_line + content_height - 2 < len(lines):
+        if start_line + content_height - 2 < line_total:
             content_win.addstr(content_height - 1, content_width - 3, "↓")
         
         # Show status bar with file stats
-        show_status_bar(stdscr, f"Line {start_line + 1}/{len(lines)}", stats)
+        show_status_bar(stdscr, f"Line {start_line + 1}/{line_total}", stats)
         
-        content_win.refresh()
-        stdscr.refresh()
+        stdscr.noutrefresh()
+        content_win.noutrefresh()
+        curses.doupdate()
         
         key = content_win.getch()
         
@@ -2546,23 +3107,21 @@ def display_daily_content(stdscr, filename, content):
             if start_line > 0:
                 start_line -= 1
         elif key == curses.KEY_DOWN:
-            if start_line + content_height - 2 < len(lines):
+            if start_line + content_height - 2 < line_total:
                 start_line += 1
         elif key == curses.KEY_PPAGE:
             start_line = max(0, start_line - content_height + 2)
         elif key == curses.KEY_NPAGE:
-            start_line = min(len(lines) - content_height + 2, start_line + content_height - 2)
+            start_line = min(max(0, line_total - content_height + 2), start_line + content_height - 2)
         elif key == curses.KEY_HOME:
             start_line = 0
         elif key == curses.KEY_END:
-            start_line = max(0, len(lines) - content_height + 2)
+            start_line = max(0, line_total - content_height + 2)
         elif key == 3:  # Ctrl+C - Copy to clipboard
             if copy_entry_to_clipboard(content):
-                show_status_bar(stdscr, "Content copied to clipboard!")
-                time.sleep(1)
+                flash_status(stdscr, "Content copied to clipboard!")
             else:
-                show_status_bar(stdscr, "Failed to copy to clipboard")
-                time.sleep(1)
+                flash_status(stdscr, "Failed to copy to clipboard")
         elif key == 8:  # Ctrl+H - Help
             show_help_overlay(stdscr)
         elif key == 27:  # ESC
@@ -2574,96 +3133,212 @@ def parse_entries_from_content(content, filename):
     if not content.strip():
         return entries
     
-    lines = content.split('\n')
-    current_entry = None
-    current_content = []
-    
-    for line in lines:
-        if line.strip().startswith('# '):
-            # Save previous entry
-            if current_entry:
-                # Extract tags from the end of content
-                content_text = '\n'.join(current_content).strip()
-                tags = extract_tags_from_end_of_content(content_text)
-                current_entry['content'] = content_text
-                current_entry['tags'] = tags
-                entries.append(current_entry)
-            
-            # Start new entry
-            title = line[2:].strip()
-            current_entry = {
-                'filename': filename,
-                'title': title,
-                'tags': '',
-                'content': '',
-                'entry_index': len(entries)
-            }
-            current_content = []
-            
-        elif current_entry:
-            current_content.append(line)
-    
-    # Add the last entry
-    if current_entry:
-        # Extract tags from the end of content
-        content_text = '\n'.join(current_content).strip()
-        tags = extract_tags_from_end_of_content(content_text)
-        current_entry['content'] = content_text
-        current_entry['tags'] = tags
-        entries.append(current_entry)
+    # Locate heading lines, then slice each entry's body straight out of content
+    headings = []
+    for match in _HEADING_RE.finditer(content):
+        line_end = content.find('\n', match.end())
+        if line_end == -1:
+            line_end = len(content)
+        headings.append((match.start(), line_end))
+    
+    for i, (line_start, line_end) in enumerate(headings):
+        body_end = headings[i + 1][0] if i + 1 < len(headings) else len(content)
+        content_text = content[line_end + 1:body_end].strip()
+        entries.append({
+            'filename': filename,
+            'title': content[line_start + 2:line_end].strip(),
+            'tags': extract_tags_from_end_of_content(content_text),
+            'content': content_text,
+            'entry_index': i
+        })
     
     return entries
 
 def extract_tags_from_end_of_content(content):
     """Extract tags from the end of content in @tag format"""
+    # Only the last non-blank line can hold the tags, so avoid splitting the whole entry
+    content = content.rstrip()
     if not content:
         return ""
     
-    lines = content.split('\n')
+    line = content[content.rfind('\n') + 1:]
     tags = []
+    for word in line.split():
+        if word.startswith('@'):
+            tag = word[1:].rstrip('.,;:!?')
+            if tag and any(c.isalnum() for c in tag):
+                tags.append(tag.lower())
     
-    # Look for @tags at the end of the content
-    for line in reversed(lines):
-        line = line.strip()
-        if not line:
-            continue
-        
-        # Check if this line contains @tags
-        words = line.split()
-        line_tags = []
-        for word in words:
-            if word.startswith('@'):
-                tag = word[1:].rstrip('.,;:!?')
-                if tag and any(c.isalnum() for c in tag):
-                    line_tags.append(tag.lower())
-        
-        if line_tags:
-            # Found tags, add them and stop looking
-            tags.extend(reversed(line_tags))  # Reverse to maintain order
-            break
-        elif line.startswith('#'):
-            # Found a header, stop looking
-            break
-        else:
-            # This line doesn't contain tags, stop looking
-            break
-    
-    return ", ".join(reversed(tags))  # Reverse again to get original order
+    return ", ".join(tags)
 
 def get_all_entries():
     """Get all individual entries from all daily files"""
-    all_entries = []
+    global _ALL_ENTRIES_CACHE
     files = get_daily_files()
+    journal_dir = get_settings()["journal_directory"]
+    stamps = [_file_stamp(os.path.join(journal_dir, filename)) for filename in files]
+    cache = _ALL_ENTRIES_CACHE
+    if cache is not None and cache[0] is files and cache[1] == stamps:
+        return cache[2]
+    entries = get_entries_from_files(files, stamps)
+    # A file that could not be stat'ed has no stamp to check next time
+    _ALL_ENTRIES_CACHE = (files, stamps, entries) if None not in stamps else None
+    
+    # Drop parses of files that were deleted, renamed or left behind by a
+    # journal directory change so the cache stays bounded by the journal itself
+    if len(_ENTRY_CACHE) > len(files):
+        current = {os.path.join(journal_dir, filename) for filename in files}
+        for filepath in [path for path in _ENTRY_CACHE if path not in current]:
+            del _ENTRY_CACHE[filepath]
+    return entries
+
+def _index_entry(entry, mtime_ns=None):
+    """Attach derived lookup fields to a parsed entry"""
+    tags = entry['tags']
+    if ',' in tags:
+        entry['_tags'] = tuple(tag.strip() for tag in tags.split(',') if tag.strip())
+    else:
+        # Untagged and single-tag entries are the common case; skip the split
+        tag = tags.strip()
+        entry['_tags'] = (tag,) if tag else ()
+    entry['_tags_set'] = frozenset(tag.lower() for tag in entry['_tags'])
+    entry['_title_lc'] = entry['title'].lower()
+    entry['_tags_lc'] = entry['tags'].lower()
+    entry['_content_lc'] = entry['content'].lower()
+    entry['_word_count'] = get_word_count(entry['content'])
+    try:
+        entry['_date'] = _parse_ymd(entry['filename'].replace('.md', ''))
+    except ValueError:
+        entry['_date'] = None
+    entry['_mtime'] = mtime_ns
+    return entry
+
+def entry_contains(entry, term_lc):
+    """Check whether a lowercased term occurs in an entry's title, tags or content"""
+    # Only a term containing the joining space can match across field boundaries
+    if ' ' in term_lc:
+        return term_lc in f"{entry['_title_lc']} {entry['_tags_lc']} {entry['_content_lc']}"
+    return term_lc in entry['_title_lc'] or term_lc in entry['_tags_lc'] or term_lc in entry['_content_lc']
+
+def _file_stamp(filepath):
+    """Return (mtime_ns, size) for a journal file, or None if it can't be stat'ed"""
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return None
+    # Size too, since a same-tick rewrite can leave a coarse mtime unchanged
+    return (st.st_mtime_ns, st.st_size)
+
+def get_entries_from_files(files, stamps=None):
+    """Get all individual entries from the given daily files, reusing cached parses"""
+    journal_dir = get_settings()["journal_directory"]
+    if stamps is None:
+        stamps = [_file_stamp(os.path.join(journal_dir, filename)) for filename in files]
+    entries_by_file = {}
+    stale = []
+    
+    for filename, stamp in zip(files, stamps):
+        filepath = os.path.join(journal_dir, filename)
+        cached = _ENTRY_CACHE.get(filepath)
+        if stamp is not None and cached is not None and cached[0] == stamp:
+            entries_by_file[filename] = cached[1]
+        else:
+            stale.append((filename, filepath, stamp))
     
-    for filename in files:
-        content = read_daily_file(filename)
+    # File reads are I/O bound, so overlap them across a small thread pool
+    stale_names = [filename for filename, _, _ in stale]
+    if len(stale_names) > 1:
+        with ThreadPoolExecutor(max_workers=get_io_workers()) as executor:
+            contents = list(executor.map(read_daily_file, stale_names))
+    else:
+        contents = [read_daily_file(filename) for filename in stale_names]
+    
+    for (filename, filepath, stamp), content in zip(stale, contents):
         entries = parse_entries_from_content(content, filename)
-        all_entries.extend(entries)
+        for entry in entries:
+            _index_entry(entry, stamp and stamp[0])
+        entries_by_file[filename] = entries
+        if stamp is None:
+            _ENTRY_CACHE.pop(filepath, None)
+        else:
+            _ENTRY_CACHE[filepath] = (stamp, entries)
+    
+    all_entries = []
+    for filename in files:
+        all_entries.extend(entries_by_file[filename])
     
     # Sort by filename (date) and entry index
-    all_entries.sort(key=lambda x: (x['filename'], x['entry_index']), reverse=True)
+    all_entries.sort(key=operator.itemgetter('filename', 'entry_index'), reverse=True)
     return all_entries
 
+def get_entry_columns(entries):
+    """Get per-field parallel lists (structure of arrays) for a list of entries"""
+    global _ENTRY_COLUMNS_CACHE
+    if _ENTRY_COLUMNS_CACHE is not None:
+        cached_entries, columns = _ENTRY_COLUMNS_CACHE
+        # Unchanged files reuse their entry dicts, so identity tells us nothing changed
+        if cached_entries is entries or (
+                len(cached_entries) == len(entries) and all(map(operator.is_, cached_entries, entries))):
+            return columns
+    
+    columns = {
+        "names": [entry['filename'][:-3] for entry in entries],
+        "dates": [entry['_date'] for entry in entries],
+        "tag_sets": [entry['_tags_set'] for entry in entries],
+        "word_counts": [entry['_word_count'] for entry in entries],
+    }
+    # Holding the entries keeps their ids from being reused while cached
+    _ENTRY_COLUMNS_CACHE = (entries, columns)
+    return columns
+
+def find_entries_containing(entries, term_lc):
+    """Return the indices of entries whose title, tags or content contain a lowercased term"""
+    columns = get_entry_columns(entries)
+    if "search_blob" not in columns:
+        # Built on first search: every entry's searchable text in one NUL-joined buffer
+        texts = [f"{entry['_title_lc']} {entry['_tags_lc']} {entry['_content_lc']}" for entry in entries]
+        starts = []
+        offset = 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + 1
+        columns["search_blob"] = '\x00'.join(texts)
+        columns["search_starts"] = starts
+    blob = columns["search_blob"]
+    starts = columns["search_starts"]
+    
+    if not term_lc:
+        return list(range(len(entries)))
+    
+    # One C-level find per matching entry instead of a Python loop over every entry
+    hits = []
+    pos = 0
+    while True:
+        found = blob.find(term_lc, pos)
+        if found == -1:
+            break
+        idx = bisect.bisect_right(starts, found) - 1
+        entry_end = starts[idx + 1] - 1 if idx + 1 < len(starts) else len(blob)
+        # A hit running past the entry's end only spans the separator
+        if found + len(term_lc) <= entry_end or entry_contains(entries[idx], term_lc):
+            hits.append(idx)
+        if idx + 1 >= len(starts):
+            break
+        pos = starts[idx + 1]
+    return hits
+
+def filter_entries_by_tags(entries, target_tags):
+    """Return entries carrying any of the given lowercased tags"""
+    target_set = frozenset(target_tags)
+    tag_sets = get_entry_columns(entries)["tag_sets"]
+    
+    # A single tag is the common case and needs only a membership test
+    if len(target_set) == 1:
+        (target_tag,) = target_set
+        return [entries[i] for i, entry_tags in enumerate(tag_sets) if target_tag in entry_tags]
+    
+    return [entries[i] for i, entry_tags in enumerate(tag_sets) if entry_tags & target_set]
+
 def get_entry_display_name(entry):
     """Get a display name for an entry"""
     date_part = entry['filename'].replace('.md', '')
@@ -2689,30 +3364,52 @@ def select_daily_file(stdscr, action):
         stdscr.getch()
         return
     
+    journal_dir = get_settings()["journal_directory"]
+    prefetch_file_stats([os.path.join(journal_dir, filename) for filename in files])
+    height, width = stdscr.getmaxyx()
+    list_top = 3
+    visible_rows = max(1, height - list_top - 1)
     idx = 0
+    top = 0
+    stats_idx = None
+    
+    # Render the file list into a pad; moving the selection only repaints two rows
+    def draw_item(pad, y, i):
+        prefix = "> " if i == idx else "  "
+        attr = curses.A_REVERSE if i == idx else 0
+        safe_addstr(pad, y, 2, f"{prefix}{files[i]}", attr)
+    
+    render_row, show_rows = make_list_pad(len(files), width, draw_item)
+    
+    stdscr.clear()
+    safe_addstr(stdscr, 0, 0, f"{action} Daily Journal (ESC to cancel):")
+    safe_addstr(stdscr, 1, 0, f"Found {len(files)} journal file(s)")
     while True:
-        stdscr.clear()
-        safe_addstr(stdscr, 0, 0, f"{action} Daily Journal (ESC to cancel):")
-        safe_addstr(stdscr, 1, 0, f"Found {len(files)} journal file(s)")
-        
-        # Show file stats
-        if idx < len(files):
+        # Show file stats, looked up only when the selection moves
+        if stats_idx != idx:
             selected_file = files[idx]
-            filepath = os.path.join(get_settings()["journal_directory"], selected_file)
-            stats = get_file_stats(filepath)
+            stats = get_file_stats(os.path.join(journal_dir, selected_file))
+            stats_idx = idx
             show_status_bar(stdscr, f"Selected: {selected_file}", stats)
         
-        for i, filename in enumerate(files):
-            prefix = "> " if i == idx else "  "
-            attr = curses.A_REVERSE if i == idx else 0
-            safe_addstr(stdscr, i+3, 2, f"{prefix}{filename}", attr)
-            
+        # Keep the selection inside the visible window
+        if idx < top:
+            top = idx
+        elif idx >= top + visible_rows:
+            top = idx - visible_rows + 1
+        
+        stdscr.noutrefresh()
+        show_rows(top, list_top, visible_rows)
+        curses.doupdate()
+        
         key = stdscr.getch()
         
-        if key == curses.KEY_UP:
-            idx = (idx - 1) % len(files)
-        elif key == curses.KEY_DOWN:
-            idx = (idx + 1) % len(files)
+        if key == curses.KEY_UP or key == curses.KEY_DOWN:
+            previous = idx
+            step = -1 if key == curses.KEY_UP else 1
+            idx = (idx + step) % len(files)
+            render_row(previous)
+            render_row(idx)
         elif is_selection_key(key):
             filename = files[idx]
             content = read_daily_file(filename)
@@ -2733,8 +3430,16 @@ def edit_daily_file(stdscr, filename, content):
     else:
         lines = content.split('\n')
     
+    # Lines before the cursor line sit on the above stack and lines after it on
+    # the below stack (nearest last), so splitting and joining lines is O(1);
+    # the cursor line itself is a list of characters edited in place
+    above = []
+    current = list(lines[0])
+    below = lines[:0:-1]
+    
     edit_height = height - 3
     edit_width = width - 4
+    text_width = edit_width - 2
     edit_win = curses.newwin(edit_height, edit_width, 1, 2)
     edit_win.box()
     edit_win.addstr(0, 2, f" Editing: {filename} ")
@@ -2744,33 +3449,94 @@ def edit_daily_file(stdscr, filename, content):
     cursor_line = 0
     cursor_col = 0
     display_start = 0
+    display_col_start = 0
     modified = False
     
+    # Running totals for the status bar, adjusted per edit
+    text = '\n'.join(lines)
+    word_count = get_word_count(text)
+    char_count = len(text)
+    last_status = None
+    
+    def line_count():
+        return len(above) + 1 + len(below)
+    
+    def line_at(line_idx):
+        if line_idx < cursor_line:
+            return above[line_idx]
+        if line_idx == cursor_line:
+            return ''.join(current)
+        return below[cursor_line - line_idx]
+    
+    def all_lines():
+        return itertools.chain(above, (''.join(current),), reversed(below))
+    
+    def visible_text(line_idx):
+        """The slice of a line inside the horizontal viewport"""
+        if line_idx == cursor_line:
+            return ''.join(current[display_col_start:display_col_start + text_width])
+        return line_at(line_idx)[display_col_start:display_col_start + text_width]
+    
+    def follow_cursor_col():
+        """Scroll horizontally to keep the cursor visible; True if the view moved"""
+        nonlocal display_col_start
+        if cursor_col < display_col_start:
+            display_col_start = cursor_col
+        elif cursor_col >= display_col_start + text_width:
+            display_col_start = cursor_col - text_width + 1
+        else:
+            return False
+        return True
+    
+    def finish_redraw():
+        """Place the cursor, update the status bar and push both windows to the screen"""
+        cursor_display_line = cursor_line - display_start + 1
+        if 1 <= cursor_display_line < edit_height - 1:
+            edit_win.move(cursor_display_line, cursor_col - display_col_start + 1)
+        
+        # Show status bar, skipping the repaint when none of its numbers changed
+        nonlocal last_status
+        status = (cursor_line, line_count(), word_count, char_count)
+        if status != last_status:
+            last_status = status
+            stats = {"words": word_count, "lines": status[1], "chars": char_count}
+            show_status_bar(stdscr, f"Line {cursor_line + 1}/{status[1]} | Ctrl+S save, Ctrl+Q quit ({_PLATFORM_NAME})", stats)
+        
+        stdscr.noutrefresh()
+        edit_win.noutrefresh()
+        curses.doupdate()
+    
+    def move_cursor_only():
+        """Move the terminal cursor within the line; the text and status bar are unchanged"""
+        edit_win.move(cursor_line - display_start + 1, cursor_col - display_col_start + 1)
+        edit_win.refresh()
+    
     def redraw_editor():
+        nonlocal last_status
+        last_status = None
+        follow_cursor_col()
         edit_win.clear()
         edit_win.box()
         edit_win.addstr(0, 2, f" Editing: {filename} {'*' if modified else ''}")
         
+        total = line_count()
         for i in range(edit_height - 2):
             line_idx = display_start + i
-            if line_idx < len(lines):
-                line = lines[line_idx]
-                if len(line) > edit_width - 2:
-                    line = line[:edit_width - 5] + "..."
-                edit_win.addstr(i + 1, 1, line)
-        
-        cursor_display_line = cursor_line - display_start + 1
-        if 1 <= cursor_display_line < edit_height - 1:
-            edit_win.move(cursor_display_line, min(cursor_col + 1, edit_width - 2))
-        
-        # Show status bar
-        stats = {"words": get_word_count('\n'.join(lines)), "lines": len(lines), "chars": len('\n'.join(lines))}
-        shortcuts = get_platform_shortcuts()
-        platform_name = "Mac" if platform.system() == "Darwin" else "Linux/Windows"
-        show_status_bar(stdscr, f"Line {cursor_line + 1}/{len(lines)} | Ctrl+S save, Ctrl+Q quit ({platform_name})", stats)
+            if line_idx < total:
+                edit_win.addstr(i + 1, 1, visible_text(line_idx))
         
-        edit_win.refresh()
-        stdscr.refresh()
+        finish_redraw()
+    
+    def redraw_line():
+        """Repaint only the cursor's line after an edit within it"""
+        row = cursor_line - display_start + 1
+        if follow_cursor_col() or not 1 <= row < edit_height - 1:
+            redraw_editor()
+            return
+        edit_win.addstr(0, 2, f" Editing: {filename} {'*' if modified else ''}")
+        # Pad over the old text rather than clrtoeol, which would erase the box edge
+        edit_win.addstr(row, 1, visible_text(cursor_line).ljust(text_width))
+        finish_redraw()
     
     redraw_editor()
     
@@ -2782,11 +3548,10 @@ def edit_daily_file(stdscr, filename, content):
             key = edit_win.getch()
             
             if key == shortcuts["save"]:  # Ctrl+S
-                write_daily_file(filename, '\n'.join(lines))
+                write_daily_file_lines(filename, all_lines())
                 modified = False
+                flash_status(stdscr, "File saved!")
                 redraw_editor()
-                show_status_bar(stdscr, "File saved!")
-                time.sleep(1)
                 continue
             elif key == shortcuts["quit"]:  # Ctrl+Q
                 if modified:
@@ -2802,7 +3567,7 @@ def edit_daily_file(stdscr, filename, content):
                     while True:
                         confirm_key = confirm_win.getch()
                         if confirm_key == ord('y') or confirm_key == ord('Y'):
-                            write_daily_file(filename, '\n'.join(lines))
+                            write_daily_file_lines(filename, all_lines())
                             return
                         elif confirm_key == ord('n') or confirm_key == ord('N'):
                             return
@@ -2812,77 +3577,101 @@ def edit_daily_file(stdscr, filename, content):
                 else:
                     return
             elif key == 3:  # Ctrl+C - Copy content
-                if copy_entry_to_clipboard('\n'.join(lines)):
-                    show_status_bar(stdscr, "Content copied to clipboard!")
-                    time.sleep(1)
+                if copy_entry_to_clipboard('\n'.join(all_lines())):
+                    flash_status(stdscr, "Content copied to clipboard!")
                     redraw_editor()
             elif key == 8:  # Ctrl+H - Help
                 show_help_overlay(stdscr)
                 redraw_editor()
             elif key == curses.KEY_UP:
-                if cursor_line > 0:
+                if above:
+                    below.append(''.join(current))
+                    current = list(above.pop())
                     cursor_line -= 1
-                    cursor_col = min(cursor_col, len(lines[cursor_line]))
-                    if cursor_line < display_start:
-                        display_start = cursor_line
-                    redraw_editor()
+                    cursor_col = min(cursor_col, len(current))
+                    if cursor_line < display_start or follow_cursor_col():
+                        display_start = min(display_start, cursor_line)
+                        redraw_editor()
+                    else:
+                        finish_redraw()
             elif key == curses.KEY_DOWN:
-                if cursor_line < len(lines) - 1:
+                if below:
+                    above.append(''.join(current))
+                    current = list(below.pop())
                     cursor_line += 1
-                    cursor_col = min(cursor_col, len(lines[cursor_line]))
-                    if cursor_line >= display_start + edit_height - 2:
-                        display_start = cursor_line - edit_height + 3
-                    redraw_editor()
+                    cursor_col = min(cursor_col, len(current))
+                    if cursor_line >= display_start + edit_height - 2 or follow_cursor_col():
+                        display_start = max(display_start, cursor_line - edit_height + 3)
+                        redraw_editor()
+                    else:
+                        finish_redraw()
             elif key == curses.KEY_LEFT:
                 if cursor_col > 0:
                     cursor_col -= 1
-                    redraw_editor()
+                    if follow_cursor_col():
+                        redraw_editor()
+                    else:
+                        move_cursor_only()
             elif key == curses.KEY_RIGHT:
-                if cursor_col < len(lines[cursor_line]):
+                if cursor_col < len(current):
                     cursor_col += 1
-                    redraw_editor()
+                    if follow_cursor_col():
+                        redraw_editor()
+                    else:
+                        move_cursor_only()
             elif key == curses.KEY_HOME:
                 cursor_col = 0
-                redraw_editor()
+                if follow_cursor_col():
+                    redraw_editor()
+                else:
+                    move_cursor_only()
             elif key == curses.KEY_END:
-                cursor_col = len(lines[cursor_line])
-                redraw_editor()
+                cursor_col = len(current)
+                if follow_cursor_col():
+                    redraw_editor()
+                else:
+                    move_cursor_only()
             elif key in (curses.KEY_BACKSPACE, 127, 8):
                 if cursor_col > 0:
-                    lines[cursor_line] = lines[cursor_line][:cursor_col-1] + lines[cursor_line][cursor_col:]
                     cursor_col -= 1
+                    removed = current.pop(cursor_col)
+                    word_count -= _word_count_delta(current, cursor_col, removed)
+                    char_count -= 1
                     modified = True
-                    redraw_editor()
-                elif cursor_line > 0:
-                    prev_line = lines[cursor_line - 1]
-                    current_line = lines[cursor_line]
-                    lines[cursor_line - 1] = prev_line + current_line
-                    del lines[cursor_line]
+                    redraw_line()
+                elif above:
+                    prev_line = above.pop()
+                    current[:0] = prev_line
                     cursor_line -= 1
                     cursor_col = len(prev_line)
+                    word_count -= _word_count_delta(current, cursor_col, '\n')
+                    char_count -= 1
                     modified = True
                     redraw_editor()
             elif key == curses.KEY_DC:
-                if cursor_col < len(lines[cursor_line]):
-                    lines[cursor_line] = lines[cursor_line][:cursor_col] + lines[cursor_line][cursor_col+1:]
+                if cursor_col < len(current):
+                    removed = current.pop(cursor_col)
+                    word_count -= _word_count_delta(current, cursor_col, removed)
+                    char_count -= 1
                     modified = True
-                    redraw_editor()
+                    redraw_line()
             elif is_enter_key(key):
-                current_line = lines[cursor_line]
-                lines[cursor_line] = current_line[:cursor_col]
-                lines.insert(cursor_line + 1, current_line[cursor_col:])
+                word_count += _word_count_delta(current, cursor_col, '\n')
+                char_count += 1
+                above.append(''.join(current[:cursor_col]))
+                del current[:cursor_col]
                 cursor_line += 1
                 cursor_col = 0
                 modified = True
                 redraw_editor()
             elif 32 <= key <= 126:
-                current_line = lines[cursor_line]
-                lines[cursor_line] = current_line[:cursor_col]
-                lines.insert(cursor_line + 1, current_line[cursor_col:])
-                cursor_line += 1
-                cursor_col = 0
+                ch = chr(key)
+                word_count += _word_count_delta(current, cursor_col, ch)
+                char_count += 1
+                current.insert(cursor_col, ch)
+                cursor_col += 1
                 modified = True
-                redraw_editor()
+                redraw_line()
                 
         except KeyboardInterrupt:
             break
@@ -2908,17 +3697,17 @@ def search_entries(stdscr):
     all_entries = get_all_entries()
     matching_entries = []
     
-    for entry in all_entries:
-        searchable_text = f"{entry['title']} {entry['tags']} {entry['content']}".lower()
-        if search_term in searchable_text:
-            match_location = []
-            if search_term in entry['title'].lower():
-                match_location.append("title")
-            if entry['tags'] and search_term in entry['tags'].lower():
-                match_location.append("tags")
-            if search_term in entry['content'].lower():
-                match_location.append("content")
-            matching_entries.append((entry, ", ".join(match_location)))
+    # Entries carry lowercased copies of each field from indexing time
+    for i in find_entries_containing(all_entries, search_term):
+        entry = all_entries[i]
+        match_location = []
+        if search_term in entry['_title_lc']:
+            match_location.append("title")
+        if search_term in entry['_tags_lc']:
+            match_location.append("tags")
+        if search_term in entry['_content_lc']:
+            match_location.append("content")
+        matching_entries.append((entry, ", ".join(match_location)))
     
     if not matching_entries:
         stdscr.clear()
@@ -2965,8 +3754,7 @@ def search_entries(stdscr):
             selected_entry = matching_entries[idx][0]
             entry_text = f"# {selected_entry['title']}\n\ntags: {selected_entry['tags']}\n\n{selected_entry['content']}"
             if copy_entry_to_clipboard(entry_text):
-                show_status_bar(stdscr, "Entry copied to clipboard!")
-                time.sleep(1)
+                flash_status(stdscr, "Entry copied to clipboard!")
         elif key == 27:  # ESC
             break
 
@@ -3028,6 +3816,9 @@ def show_statistics(stdscr):
     stdscr.clear()
     safe_addstr(stdscr, 0, 0, "Journal Statistics")
     
+    settings = get_settings()
+    journal_dir = settings["journal_directory"]
+    date_format = settings["date_format"]
     files = get_daily_files()
     entries = get_all_entries()
     
@@ -3043,7 +3834,7 @@ def show_statistics(stdscr):
     total_files = len(files)
     
     for filename in files:
-        filepath = os.path.join(get_settings()["journal_directory"], filename)
+        filepath = os.path.join(journal_dir, filename)
         stats = get_file_stats(filepath)
         total_words += stats['words']
     
@@ -3052,13 +3843,25 @@ def show_statistics(stdscr):
     week_ago = today - timedelta(days=7)
     recent_entries = 0
     
-    for entry in entries:
-        try:
-            entry_date = datetime.strptime(entry['filename'].replace('.md', ''), get_settings()['date_format']).date()
-            if entry_date >= week_ago:
+    if date_format == _FAST_DATE_FMT:
+        # ISO filenames sort by date and entries come newest file first, so only
+        # the leading run at or after the cutoff name needs its parsed date checked
+        cutoff = week_ago.strftime(date_format) + '.md'
+        cutoff_dt = datetime(week_ago.year, week_ago.month, week_ago.day)
+        for entry in entries:
+            if entry['filename'] < cutoff:
+                break
+            entry_date = entry['_date']
+            if entry_date is not None and entry_date >= cutoff_dt:
                 recent_entries += 1
-        except:
-            pass
+    else:
+        for entry in entries:
+            try:
+                entry_date = datetime.strptime(entry['filename'].replace('.md', ''), date_format).date()
+                if entry_date >= week_ago:
+                    recent_entries += 1
+            except:
+                pass
     
     # Display statistics
     y_pos = 2
@@ -3083,7 +3886,7 @@ def show_statistics(stdscr):
     safe_addstr(stdscr, y_pos, 0, f"📝 Recent Files:")
     y_pos += 1
     for i, filename in enumerate(files[:5]):
-        filepath = os.path.join(get_settings()["journal_directory"], filename)
+        filepath = os.path.join(journal_dir, filename)
         stats = get_file_stats(filepath)
         safe_addstr(stdscr, y_pos, 2, f"{filename} - {stats['words']} words")
         y_pos += 1
@@ -3157,44 +3960,51 @@ def settings_menu(stdscr):
     label_width = max(len(item) for item in menu if item)
     status_pad = 4  # spaces between label and status
 
-    while True:
-        stdscr.clear()
-        safe_addstr(stdscr, 0, 0, "Settings")
-        safe_addstr(stdscr, 1, 0, "Configure Daily Journal")
-        
-        y_pos = 3
-        for idx, item in enumerate(menu):
-            if item == "":
-                y_pos += 1
-                continue
-            status = get_status(item)
-            if status is not None:
-                label = item.ljust(label_width + status_pad)
-                display = f"{label}[{status}]"
+    def draw_row(idx):
+        item = menu[idx]
+        status = get_status(item)
+        if status is not None:
+            label = item.ljust(label_width + status_pad)
+            display = f"{label}[{status}]"
+        else:
+            display = item
+        try:
+            if idx == current_row:
+                safe_addstr(stdscr, idx + 3, 2, f"> {display}", curses.A_REVERSE)
             else:
-                display = item
-            try:
-                if idx == current_row:
-                    safe_addstr(stdscr, y_pos, 2, f"> {display}", curses.A_REVERSE)
-                else:
-                    safe_addstr(stdscr, y_pos, 2, f"  {display}")
-            except:
-                pass
-            y_pos += 1
-        
-        # Show current setting values
-        show_status_bar(stdscr, f"Journal: {settings['journal_directory']}")
+                safe_addstr(stdscr, idx + 3, 2, f"  {display}")
+        except:
+            pass
+
+    selectable = [i for i, item in enumerate(menu) if item]
+
+    # Only a returning submenu or a changed setting needs the whole menu repainted
+    need_redraw = True
+    while True:
+        if need_redraw:
+            stdscr.clear()
+            safe_addstr(stdscr, 0, 0, "Settings")
+            safe_addstr(stdscr, 1, 0, "Configure Daily Journal")
+            for idx, item in enumerate(menu):
+                if item:
+                    draw_row(idx)
+            
+            # Show current setting values
+            show_status_bar(stdscr, f"Journal: {settings['journal_directory']}")
+            need_redraw = False
         
         key = stdscr.getch()
-        if key == curses.KEY_UP:
-            current_row = (current_row - 1) % len(menu)
-            while current_row > 0 and menu[current_row] == "":
-                current_row = (current_row - 1) % len(menu)
-        elif key == curses.KEY_DOWN:
-            current_row = (current_row + 1) % len(menu)
-            while current_row < len(menu) - 1 and menu[current_row] == "":
-                current_row = (current_row + 1) % len(menu)
+        if key == curses.KEY_UP or key == curses.KEY_DOWN:
+            previous = current_row
+            if key == curses.KEY_UP:
+                current_row = step_menu_row(selectable, current_row, -1)
+            else:
+                current_row = step_menu_row(selectable, current_row, 1)
+            if current_row != previous:
+                draw_row(previous)
+                draw_row(current_row)
         elif is_selection_key(key):
+            need_redraw = True
             if menu[current_row] == "Journal Directory":
                 edit_setting(stdscr, "journal_directory", "Journal Directory", settings)
             elif menu[current_row] == "Backup Directory":
@@ -3360,6 +4170,19 @@ def export_settings(stdscr, settings):
         stdscr.addstr(2, 0, "Press any key to continue...")
         stdscr.getch()
 
+def load_json_file(path):
+    """Parse a JSON file, using orjson when it is installed"""
+    global _JSON_LOADS
+    if _JSON_LOADS is None:
+        try:
+            # Optional dependency - parses straight from bytes in C
+            import orjson
+            _JSON_LOADS = orjson.loads
+        except ImportError:
+            _JSON_LOADS = json.loads
+    with open(path, 'rb') as f:
+        return _JSON_LOADS(f.read())
+
 def import_settings(stdscr):
     """Import settings from a file"""
     import_path = os.path.expanduser("~/daily_journal_settings_export.json")
@@ -3372,8 +4195,7 @@ def import_settings(stdscr):
             stdscr.getch()
             return
         
-        with open(import_path, 'r') as f:
-            imported_settings = json.load(f)
+        imported_settings = load_json_file(import_path)
         
         # Merge with defaults to ensure all keys exist
         final_settings = {**DEFAULT_SETTINGS, **imported_settings}
@@ -3407,148 +4229,129 @@ def main_menu(stdscr):
     stdscr.keypad(True)
     current_row = 0
     
+    def edit_today(stdscr):
+        today_file = get_today_filename()
+        content = read_daily_file(today_file)
+        edit_daily_file(stdscr, today_file, content)
+    
+    # Menu rows as (action id, label); (None, "") rows are separators
     menu = [
-        "📝 New Blank Entry [Ctrl+N]",
-        "📝 New Entry with Template [Ctrl+T]",
-        "📝 New Entry (Editor)",
-        "",
-        "📖 Read Daily File",
-        "📖 Read Entry",
-        "",
-        "✏️  Edit Today's Journal [Ctrl+O]",
-        "✏️  Edit Entry",
-        "✏️  Edit Daily File",
-        "",
-        "🔍 Search Entries [Ctrl+F]",
-        "🔍 Advanced Search",
-        "📊 Journal Statistics",
-        "",
-        "📤 Export Entries",
-        "📥 Import Entries",
-        "",
-        "📋 View Templates",
-        "🏷️  Tag Management",
-        "",
-        "💾 Create Backup [Ctrl+B]",
-        "⚙️  Settings [Ctrl+S]",
-        "",
-        "❓ Help [Ctrl+H]",
-        "",
-        "🚪 Exit"
+        ("new_blank", "📝 New Blank Entry [Ctrl+N]"),
+        ("new_template", "📝 New Entry with Template [Ctrl+T]"),
+        ("new_editor", "📝 New Entry (Editor)"),
+        (None, ""),
+        ("read_file", "📖 Read Daily File"),
+        ("read_entry", "📖 Read Entry"),
+        (None, ""),
+        ("edit_today", "✏️  Edit Today's Journal [Ctrl+O]"),
+        ("edit_entry", "✏️  Edit Entry"),
+        ("edit_file", "✏️  Edit Daily File"),
+        (None, ""),
+        ("search", "🔍 Search Entries [Ctrl+F]"),
+        ("advanced_search", "🔍 Advanced Search"),
+        ("statistics", "📊 Journal Statistics"),
+        (None, ""),
+        ("export", "📤 Export Entries"),
+        ("import", "📥 Import Entries"),
+        (None, ""),
+        ("templates", "📋 View Templates"),
+        ("tags", "🏷️  Tag Management"),
+        (None, ""),
+        ("backup", "💾 Create Backup [Ctrl+B]"),
+        ("settings", "⚙️  Settings [Ctrl+S]"),
+        (None, ""),
+        ("help", "❓ Help [Ctrl+H]"),
+        (None, ""),
+        ("exit", "🚪 Exit")
     ]
     
-    while True:
-        stdscr.clear()
-        
-        # Header
+    actions = {
+        "new_blank": lambda stdscr: new_blank_entry(stdscr, use_editor=False),
+        "new_template": lambda stdscr: new_entry_with_template(stdscr, use_editor=False),
+        "new_editor": lambda stdscr: new_entry_with_template(stdscr, use_editor=True),
+        "read_file": lambda stdscr: select_daily_file(stdscr, "Read"),
+        "read_entry": lambda stdscr: select_entry(stdscr, "Read"),
+        "edit_today": edit_today,
+        "edit_entry": lambda stdscr: select_entry(stdscr, "Edit"),
+        "edit_file": lambda stdscr: select_daily_file(stdscr, "Edit"),
+        "search": search_entries,
+        "advanced_search": advanced_search_menu,
+        "statistics": show_statistics,
+        "export": export_entries_menu,
+        "import": import_entries_menu,
+        "templates": view_templates,
+        "tags": tag_management_menu,
+        "backup": manual_backup,
+        "settings": settings_menu,
+        "help": show_help_overlay,
+    }
+    
+    # Get platform-specific shortcuts
+    shortcuts = get_platform_shortcuts()
+    shortcut_actions = {
+        shortcuts["new_blank_entry"]: "new_blank",  # Ctrl+N
+        shortcuts["new_template_entry"]: "new_template",  # Ctrl+T
+        shortcuts["edit_today"]: "edit_today",  # Ctrl+O
+        shortcuts["search"]: "search",  # Ctrl+F
+        shortcuts["backup"]: "backup",  # Ctrl+B
+        shortcuts["settings"]: "settings",  # Ctrl+S
+        shortcuts["help"]: "help",  # Ctrl+H
+    }
+    
+    selectable = [i for i, (action_id, _) in enumerate(menu) if action_id]
+    
+    def draw_row(idx):
         try:
-            safe_addstr(stdscr, 0, 0, "Daily Journal", curses.A_BOLD | curses.color_pair(2))
-            safe_addstr(stdscr, 1, 0, "Terminal Journal Application")
+            if idx == current_row:
+                safe_addstr(stdscr, idx + 3, 2, f"> {menu[idx][1]}", curses.A_REVERSE)
+            else:
+                safe_addstr(stdscr, idx + 3, 2, f"  {menu[idx][1]}")
         except:
             pass
-        
-        # Show current journal info
-        files = get_daily_files()
-        entries = get_all_entries()
-        show_status_bar(stdscr, f"Files: {len(files)} | Entries: {len(entries)} | Today: {get_today_filename()}")
-        
-        y_pos = 3
-        for idx, item in enumerate(menu):
-            if item == "":
-                y_pos += 1
-                continue
-                
+    
+    # The journal only changes through the actions launched from here, so the
+    # screen (and its file and entry counts) is rebuilt only after one returns
+    need_redraw = True
+    while True:
+        if need_redraw:
+            stdscr.clear()
+            
+            # Header
             try:
-                if idx == current_row:
-                    safe_addstr(stdscr, y_pos, 2, f"> {item}", curses.A_REVERSE)
-                else:
-                    safe_addstr(stdscr, y_pos, 2, f"  {item}")
+                safe_addstr(stdscr, 0, 0, "Daily Journal", curses.A_BOLD | curses.color_pair(2))
+                safe_addstr(stdscr, 1, 0, "Terminal Journal Application")
             except:
                 pass
-            y_pos += 1
+            
+            # Show current journal info
+            files = get_daily_files()
+            entries = get_all_entries()
+            show_status_bar(stdscr, f"Files: {len(files)} | Entries: {len(entries)} | Today: {get_today_filename()}")
+            
+            for idx in selectable:
+                draw_row(idx)
+            need_redraw = False
             
         key = stdscr.getch()
         
-        # Get platform-specific shortcuts
-        shortcuts = get_platform_shortcuts()
-        
         # Handle keyboard shortcuts
-        if key == shortcuts["new_blank_entry"]:  # Ctrl+N
-            new_blank_entry(stdscr, use_editor=False)
-            continue
-        elif key == shortcuts["new_template_entry"]:  # Ctrl+T
-            new_entry_with_template(stdscr, use_editor=False)
-            continue
-        elif key == shortcuts["edit_today"]:  # Ctrl+O
-            today_file = get_today_filename()
-            content = read_daily_file(today_file)
-            edit_daily_file(stdscr, today_file, content)
-            continue
-        elif key == shortcuts["search"]:  # Ctrl+F
-            search_entries(stdscr)
-            continue
-        elif key == shortcuts["backup"]:  # Ctrl+B
-            manual_backup(stdscr)
-            continue
-        elif key == shortcuts["settings"]:  # Ctrl+S
-            settings_menu(stdscr)
-            continue
-        elif key == shortcuts["help"]:  # Ctrl+H
-            show_help_overlay(stdscr)
+        if key in shortcut_actions:
+            actions[shortcut_actions[key]](stdscr)
+            need_redraw = True
             continue
         
         # Handle regular navigation
-        if key == curses.KEY_UP:
-            current_row = (current_row - 1) % len(menu)
-            while current_row > 0 and menu[current_row] == "":
-                current_row = (current_row - 1) % len(menu)
-        elif key == curses.KEY_DOWN:
-            current_row = (current_row + 1) % len(menu)
-            while current_row < len(menu) - 1 and menu[current_row] == "":
-                current_row = (current_row + 1) % len(menu)
+        if key == curses.KEY_UP or key == curses.KEY_DOWN:
+            previous = current_row
+            current_row = step_menu_row(selectable, current_row, -1 if key == curses.KEY_UP else 1)
+            draw_row(previous)
+            draw_row(current_row)
         elif is_selection_key(key):
-            selected_item = menu[current_row]
-            
-            if "New Blank Entry" in selected_item:
-                new_blank_entry(stdscr, use_editor=False)
-            elif "New Entry with Template" in selected_item:
-                new_entry_with_template(stdscr, use_editor=False)
-            elif "New Entry (Editor)" in selected_item:
-                new_entry_with_template(stdscr, use_editor=True)
-            elif "Read Daily File" in selected_item:
-                select_daily_file(stdscr, "Read")
-            elif "Read Entry" in selected_item:
-                select_entry(stdscr, "Read")
-            elif "Edit Today's Journal" in selected_item:
-                today_file = get_today_filename()
-                content = read_daily_file(today_file)
-                edit_daily_file(stdscr, today_file, content)
-            elif "Edit Entry" in selected_item:
-                select_entry(stdscr, "Edit")
-            elif "Edit Daily File" in selected_item:
-                select_daily_file(stdscr, "Edit")
-            elif "Search Entries" in selected_item:
-                search_entries(stdscr)
-            elif "Advanced Search" in selected_item:
-                advanced_search_menu(stdscr)
-            elif "Journal Statistics" in selected_item:
-                show_statistics(stdscr)
-            elif "Export Entries" in selected_item:
-                export_entries_menu(stdscr)
-            elif "Import Entries" in selected_item:
-                import_entries_menu(stdscr)
-            elif "View Templates" in selected_item:
-                view_templates(stdscr)
-            elif "Tag Management" in selected_item:
-                tag_management_menu(stdscr)
-            elif "Create Backup" in selected_item:
-                manual_backup(stdscr)
-            elif "Settings" in selected_item:
-                settings_menu(stdscr)
-            elif "Help" in selected_item:
-                show_help_overlay(stdscr)
-            elif "Exit" in selected_item:
+            action_id = menu[current_row][0]
+            if action_id == "exit":
                 break
+            actions[action_id](stdscr)
+            need_redraw = True
         elif key == 27:  # ESC
             break
 
@@ -3568,30 +4371,48 @@ def select_entry(stdscr, action):
         stdscr.getch()
         return
     
+    height, width = stdscr.getmaxyx()
+    list_top = 3
+    visible_rows = max(1, height - list_top - 1)
     idx = 0
+    top = 0
+    
+    # Render the entry list into a pad; moving the selection only repaints two rows
+    def draw_item(pad, y, i):
+        display_name = get_entry_display_name(entries[i])
+        prefix = "> " if i == idx else "  "
+        attr = curses.A_REVERSE if i == idx else 0
+        safe_addstr(pad, y, 2, f"{prefix}{display_name}", attr)
+    
+    render_row, show_rows = make_list_pad(len(entries), width, draw_item)
+    
+    stdscr.clear()
+    safe_addstr(stdscr, 0, 0, f"{action} Entry (ESC to cancel):")
+    safe_addstr(stdscr, 1, 0, f"Found {len(entries)} entry(ies)")
     while True:
-        stdscr.clear()
-        safe_addstr(stdscr, 0, 0, f"{action} Entry (ESC to cancel):")
-        safe_addstr(stdscr, 1, 0, f"Found {len(entries)} entry(ies)")
-        
         # Show entry preview
-        if idx < len(entries):
-            selected_entry = entries[idx]
-            preview = selected_entry['content'][:100].replace('\n', ' ')
-            show_status_bar(stdscr, f"Preview: {preview}...")
+        selected_entry = entries[idx]
+        preview = selected_entry['content'][:100].replace('\n', ' ')
+        show_status_bar(stdscr, f"Preview: {preview}...")
+        
+        # Keep the selection inside the visible window
+        if idx < top:
+            top = idx
+        elif idx >= top + visible_rows:
+            top = idx - visible_rows + 1
+        
+        stdscr.noutrefresh()
+        show_rows(top, list_top, visible_rows)
+        curses.doupdate()
         
-        for i, entry in enumerate(entries):
-            display_name = get_entry_display_name(entry)
-            prefix = "> " if i == idx else "  "
-            attr = curses.A_REVERSE if i == idx else 0
-            safe_addstr(stdscr, i+3, 2, f"{prefix}{display_name}", attr)
-            
         key = stdscr.getch()
         
-        if key == curses.KEY_UP:
-            idx = (idx - 1) % len(entries)
-        elif key == curses.KEY_DOWN:
-            idx = (idx + 1) % len(entries)
+        if key == curses.KEY_UP or key == curses.KEY_DOWN:
+            previous = idx
+            step = -1 if key == curses.KEY_UP else 1
+            idx = (idx + step) % len(entries)
+            render_row(previous)
+            render_row(idx)
         elif is_selection_key(key):
             selected_entry = entries[idx]
             if action == "Read":
@@ -3608,10 +4429,23 @@ def view_templates(stdscr):
     template_keys = list(templates.keys())
     current_row = 0
     
+    def draw_row(i):
+        template = templates[template_keys[i]]
+        prefix = "> " if i == current_row else "  "
+        attr = curses.A_REVERSE if i == current_row else 0
+        
+        template_info = f"{template['title']} - {template['tags']}"
+        safe_addstr(stdscr, i+3, 2, f"{prefix}{template_info}", attr)
+    
+    need_redraw = True
     while True:
-        stdscr.clear()
-        safe_addstr(stdscr, 0, 0, "Available Entry Templates")
-        safe_addstr(stdscr, 1, 0, "Preview template content (Enter to view full, ESC to go back)")
+        if need_redraw:
+            stdscr.clear()
+            safe_addstr(stdscr, 0, 0, "Available Entry Templates")
+            safe_addstr(stdscr, 1, 0, "Preview template content (Enter to view full, ESC to go back)")
+            for i in range(len(template_keys)):
+                draw_row(i)
+            need_redraw = False
         
         # Show template preview
         if current_row < len(template_keys):
@@ -3619,24 +4453,19 @@ def view_templates(stdscr):
             preview_lines = selected_template["content"].split('\n')[:3]
             show_status_bar(stdscr, f"Tags: {selected_template['tags']} | Preview: {' '.join(preview_lines).strip()[:80]}...")
         
-        for i, key in enumerate(template_keys):
-            template = templates[key]
-            prefix = "> " if i == current_row else "  "
-            attr = curses.A_REVERSE if i == current_row else 0
-            
-            template_info = f"{template['title']} - {template['tags']}"
-            safe_addstr(stdscr, i+3, 2, f"{prefix}{template_info}", attr)
-        
         key = stdscr.getch()
         
-        if key == curses.KEY_UP:
-            current_row = (current_row - 1) % len(template_keys)
-        elif key == curses.KEY_DOWN:
-            current_row = (current_row + 1) % len(template_keys)
+        if key == curses.KEY_UP or key == curses.KEY_DOWN:
+            previous = current_row
+            step = -1 if key == curses.KEY_UP else 1
+            current_row = (current_row + step) % len(template_keys)
+            draw_row(previous)
+            draw_row(current_row)
         elif is_selection_key(key):
             # Show full template content
             selected_template = templates[template_keys[current_row]]
             view_template_details(stdscr, selected_template)
+            need_redraw = True
         elif key == 27:  # ESC
             break
 
@@ -3656,31 +4485,36 @@ def view_template_details(stdscr, template):
     content_win.addstr(0, 2, f" {template['title']} Template ")
     content_win.keypad(True)
     
+    # The window width is fixed for this view, so clip long lines once up front
+    clip_width = content_width - 2
+    lines = [line if len(line) <= clip_width else line[:content_width - 5] + "..." for line in lines]
+    
     start_line = 0
+    drawn_start = None
+    show_status_bar(stdscr, f"Template: {template['title']} | Tags: {template['tags']} | ESC to go back")
     
     while True:
-        content_win.clear()
-        content_win.box()
-        content_win.addstr(0, 2, f" {template['title']} Template ")
-        
-        # Display visible lines
-        for i in range(content_height - 2):
-            if start_line + i < len(lines):
-                line = lines[start_line + i]
-                if len(line) > content_width - 2:
-                    line = line[:content_width - 5] + "..."
-                content_win.addstr(i + 1, 1, line)
-        
-        # Show scroll indicators
-        if start_line > 0:
-            content_win.addstr(1, content_width - 3, "↑")
-        if start_line + content_height - 2 < len(lines):
-            content_win.addstr(content_height - 1, content_width - 3, "↓")
-        
-        show_status_bar(stdscr, f"Template: {template['title']} | Tags: {template['tags']} | ESC to go back")
-        
-        content_win.refresh()
-        stdscr.refresh()
+        # Repaint only after a scroll; erase() lets curses send just the changed cells
+        if start_line != drawn_start:
+            content_win.erase()
+            content_win.box()
+            content_win.addstr(0, 2, f" {template['title']} Template ")
+            
+            # Display visible lines
+            for i in range(content_height - 2):
+                if start_line + i < len(lines):
+                    content_win.addstr(i + 1, 1, lines[start_line + i])
+            
+            # Show scroll indicators
+            if start_line > 0:
+                content_win.addstr(1, content_width - 3, "↑")
+            if start_line + content_height - 2 < len(lines):
+                content_win.addstr(content_height - 1, content_width - 3, "↓")
+            
+            stdscr.noutrefresh()
+            content_win.noutrefresh()
+            curses.doupdate()
+            drawn_start = start_line
         
         key = content_win.getch()
         
@@ -3693,7 +4527,7 @@ def view_template_details(stdscr, template):
         elif key == curses.KEY_PPAGE:
             start_line = max(0, start_line - content_height + 2)
         elif key == curses.KEY_NPAGE:
-            start_line = min(len(lines) - content_height + 2, start_line + content_height - 2)
+            start_line = min(max(0, len(lines) - content_height + 2), start_line + content_height - 2)
         elif key == curses.KEY_HOME:
             start_line = 0
         elif key == curses.KEY_END:
@@ -3702,75 +4536,68 @@ def view_template_details(stdscr, template):
             break
 
 def debug_tools_menu(stdscr):
+    # Menu rows as (tool, label); (None, "") rows are separators and the Back row has no tool
     menu = [
-        "Journal Directory Info",
-        "Parse Entries Debug",
-        "Tag Detection Test",
-        "Keyboard Shortcuts Test",
-        "Keyboard Key Codes",
-        "Create Test File",
-        "Tutorial / Help",
-        "",
-        "Back"
+        (debug_journal_info, "Journal Directory Info"),
+        (debug_parse_entries, "Parse Entries Debug"),
+        (debug_tag_detection, "Tag Detection Test"),
+        (debug_keyboard_shortcuts, "Keyboard Shortcuts Test"),
+        (debug_keyboard_keys, "Keyboard Key Codes"),
+        (create_test_file, "Create Test File"),
+        (show_tutorial, "Tutorial / Help"),
+        (None, ""),
+        (None, "Back")
     ]
     current_row = 0
+    selectable = [i for i, (_, label) in enumerate(menu) if label]
+
+    def draw_row(idx):
+        item = menu[idx][1]
+        attr = curses.A_REVERSE if idx == current_row else 0
+        safe_addstr(stdscr, idx + 3, 2, f"> {item}" if idx == current_row else f"  {item}", attr)
+
+    need_redraw = True
     while True:
-        stdscr.clear()
-        safe_addstr(stdscr, 0, 0, "Debug Tools")
-        safe_addstr(stdscr, 1, 0, "Select a debug tool to run")
-        y_pos = 3
-        for idx, item in enumerate(menu):
-            if item == "":
-                y_pos += 1
-                continue
-            attr = curses.A_REVERSE if idx == current_row else 0
-            safe_addstr(stdscr, y_pos, 2, f"> {item}" if idx == current_row else f"  {item}", attr)
-            y_pos += 1
-        show_status_bar(stdscr, "ESC or Back to return to Settings")
+        if need_redraw:
+            stdscr.clear()
+            safe_addstr(stdscr, 0, 0, "Debug Tools")
+            safe_addstr(stdscr, 1, 0, "Select a debug tool to run")
+            for idx in selectable:
+                draw_row(idx)
+            show_status_bar(stdscr, "ESC or Back to return to Settings")
+            need_redraw = False
         key = stdscr.getch()
-        if key == curses.KEY_UP:
-            current_row = (current_row - 1) % len(menu)
-            while current_row > 0 and menu[current_row] == "":
-                current_row = (current_row - 1) % len(menu)
-        elif key == curses.KEY_DOWN:
-            current_row = (current_row + 1) % len(menu)
-            while current_row < len(menu) - 1 and menu[current_row] == "":
-                current_row = (current_row + 1) % len(menu)
+        if key == curses.KEY_UP or key == curses.KEY_DOWN:
+            previous = current_row
+            current_row = step_menu_row(selectable, current_row, -1 if key == curses.KEY_UP else 1)
+            draw_row(previous)
+            draw_row(current_row)
         elif is_selection_key(key):
-            if menu[current_row] == "Journal Directory Info":
-                debug_journal_info(stdscr)
-            elif menu[current_row] == "Parse Entries Debug":
-                debug_parse_entries(stdscr)
-            elif menu[current_row] == "Tag Detection Test":
-                debug_tag_detection(stdscr)
-            elif menu[current_row] == "Keyboard Shortcuts Test":
-                debug_keyboard_shortcuts(stdscr)
-            elif menu[current_row] == "Keyboard Key Codes":
-                debug_keyboard_keys(stdscr)
-            elif menu[current_row] == "Create Test File":
-                create_test_file(stdscr)
-            elif menu[current_row] == "Tutorial / Help":
-                show_tutorial(stdscr)
-            elif menu[current_row] == "Back":
+            tool = menu[current_row][0]
+            if tool is None:  # Back
                 break
+            tool(stdscr)
+            need_redraw = True
         elif key == 27:  # ESC
             break
 
 def open_journal_folder_in_finder(stdscr):
     """Open the journal directory in Finder (macOS), Explorer (Windows), or file manager (Linux)"""
-    import platform
     settings = get_settings()
     folder = settings["journal_directory"]
     stdscr.clear()
     safe_addstr(stdscr, 0, 0, f"Opening folder: {folder}")
     stdscr.refresh()
+    # Detach the file manager from our terminal so it can't write over the curses screen
+    detached = dict(stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL, start_new_session=True)
     try:
-        if platform.system() == "Darwin":
-            subprocess.Popen(["open", folder])
-        elif platform.system() == "Windows":
-            subprocess.Popen(["explorer", folder])
+        if _PLATFORM == "Darwin":
+            subprocess.Popen(["open", folder], **detached)
+        elif _PLATFORM == "Windows":
+            subprocess.Popen(["explorer", folder], **detached)
         else:
-            subprocess.Popen(["xdg-open", folder])
+            subprocess.Popen(["xdg-open", folder], **detached)
         safe_addstr(stdscr, 2, 0, "Opened folder in file explorer.")
     except Exception as e:
         safe_addstr(stdscr, 2, 0, f"Failed to open folder: {e}")
@@ -3782,23 +4609,26 @@ def debug_journal_info(stdscr):
     stdscr.clear()
     safe_addstr(stdscr, 0, 0, "Journal Debug Information")
     safe_addstr(stdscr, 2, 0, f"Journal Directory: {settings['journal_directory']}")
-    if os.path.exists(settings["journal_directory"]):
+    # One listing answers both "does it exist" and "what is in it"
+    try:
+        all_files = os.listdir(settings["journal_directory"])
+    except FileNotFoundError:
+        safe_addstr(stdscr, 3, 0, "✗ Journal directory does not exist")
+    except Exception as e:
         safe_addstr(stdscr, 3, 0, "✓ Journal directory exists")
-        try:
-            all_files = os.listdir(settings["journal_directory"])
-            safe_addstr(stdscr, 4, 0, f"All files in directory ({len(all_files)}):")
-            for i, file in enumerate(all_files[:10]):
-                safe_addstr(stdscr, 5 + i, 2, f"  {file}")
-            if len(all_files) > 10:
-                safe_addstr(stdscr, 15, 2, f"  ... and {len(all_files) - 10} more files")
-            md_files = [f for f in all_files if f.endswith('.md')]
-            safe_addstr(stdscr, 17, 0, f"Markdown files ({len(md_files)}):")
-            for i, file in enumerate(md_files):
-                safe_addstr(stdscr, 18 + i, 2, f"  {file}")
-        except Exception as e:
-            safe_addstr(stdscr, 4, 0, f"Error listing directory: {e}")
+        safe_addstr(stdscr, 4, 0, f"Error listing directory: {e}")
     else:
-        safe_addstr(stdscr, 3, 0, "✗ Journal directory does not exist")
+        safe_addstr(stdscr, 3, 0, "✓ Journal directory exists")
+        safe_addstr(stdscr, 4, 0, f"All files in directory ({len(all_files)}):")
+        for i, file in enumerate(all_files[:10]):
+            safe_addstr(stdscr, 5 + i, 2, f"  {file}")
+        if len(all_files) > 10:
+            safe_addstr(stdscr, 15, 2, f"  ... and {len(all_files) - 10} more files")
+        # The journal files exactly as the app sees them, from the cached scan
+        md_files = get_daily_files()
+        safe_addstr(stdscr, 17, 0, f"Markdown files ({len(md_files)}):")
+        for i, file in enumerate(md_files):
+            safe_addstr(stdscr, 18 + i, 2, f"  {file}")
     safe_addstr(stdscr, 25, 0, "Press any key to continue...")
     stdscr.getch()
 
@@ -3818,14 +4648,26 @@ def debug_parse_entries(stdscr):
             break
         safe_addstr(stdscr, y_pos, 0, f"File: {filename}")
         y_pos += 1
-        content = read_daily_file(filename)
-        safe_addstr(stdscr, y_pos, 0, f"Content length: {len(content)}")
+        # The preview needs only the first 200 characters, so don't read the whole file
+        filepath = os.path.join(get_settings()["journal_directory"], filename)
+        try:
+            size = os.stat(filepath).st_size
+            with open(filepath, 'rb') as f:
+                head = f.read(800).decode('utf-8', errors='ignore')
+        except OSError as e:
+            safe_addstr(stdscr, y_pos, 0, f"Error reading file: {e}"[:width-1])
+            y_pos += 2
+            continue
+        head = head.replace('\r\n', '\n').replace('\r', '\n')
+        safe_addstr(stdscr, y_pos, 0, f"File size: {size} bytes")
         y_pos += 1
-        preview = content[:200].replace('\n', '\\n')
+        preview = head[:200].replace('\n', '\\n')
         preview = preview[:width-20]
         safe_addstr(stdscr, y_pos, 0, f"Preview: {preview}")
         y_pos += 1
-        entries = parse_entries_from_content(content, filename)
+        # Reuse the cached parse (newest entry first) when the file's mtime and size are
+        # unchanged; a rewrite that keeps both identical can show a stale parse here
+        entries = get_entries_from_files([filename])[::-1]
         safe_addstr(stdscr, y_pos, 0, f"Parsed {len(entries)} entries:")
         y_pos += 1
         for i, entry in enumerate(entries):
@@ -3849,6 +4691,38 @@ def debug_parse_entries(stdscr):
     safe_addstr(stdscr, height-2, 0, "Press any key to continue...")
     stdscr.getch()
 
+# Key names for curses builds without keyname()
+_KEY_FALLBACK_NAMES = MappingProxyType({
+    27: "ESC",
+    10: "Enter",
+    13: "Enter",
+    32: "Space",
+    127: "Backspace",
+    8: "Backspace",
+    263: "Backspace",
+    330: "KEY_DC (Delete)",
+    259: "Arrow Up",
+    258: "Arrow Down",
+    260: "Arrow Left",
+    261: "Arrow Right",
+    550: "Ctrl+Left",
+    565: "Ctrl+Right",
+    548: "Alt+Left",
+    1: "Ctrl+A",
+    5: "Ctrl+E",
+})
+
+@functools.lru_cache(maxsize=512)
+def _key_name(key):
+    """Describe a key code, memoized since the same keys repeat"""
+    if hasattr(curses, 'keyname'):
+        return curses.keyname(key).decode()
+    if key in _KEY_FALLBACK_NAMES:
+        return _KEY_FALLBACK_NAMES[key]
+    if 32 <= key <= 126:
+        return f"'{chr(key)}'"
+    return "Unknown"
+
 def debug_keyboard_keys(stdscr):
     stdscr.clear()
     safe_addstr(stdscr, 0, 0, "Debug Keyboard Keys")
@@ -3878,61 +4752,30 @@ def debug_keyboard_keys(stdscr):
     safe_addstr(stdscr, 26, 0, "  Ctrl+A: 1 (start of line)")
     safe_addstr(stdscr, 27, 0, "  Ctrl+E: 5 (end of line)")
     stdscr.refresh()
+    # Only the four value fields change per key; give them their own subwindow
+    height, width = stdscr.getmaxyx()
+    values = stdscr.derwin(4, max(1, width - 10), 3, 10)
     while True:
         key = stdscr.getch()
         if key == 27:
             break
-        for i in range(3, 7):
-            stdscr.move(i, 10)
-            stdscr.clrtoeol()
+        values.erase()
         try:
-            safe_addstr(stdscr, 3, 10, f"{key}")
-            key_name = "Unknown"
+            safe_addstr(values, 0, 0, f"{key}")
             try:
-                if hasattr(curses, 'keyname'):
-                    key_name = curses.keyname(key).decode()
-                else:
-                    if key == 27:
-                        key_name = "ESC"
-                    elif key == 10 or key == 13:
-                        key_name = "Enter"
-                    elif key == 32:
-                        key_name = "Space"
-                    elif key == 127 or key == 8 or key == 263:
-                        key_name = "Backspace"
-                    elif key == 330:
-                        key_name = "KEY_DC (Delete)"
-                    elif key == 259:
-                        key_name = "Arrow Up"
-                    elif key == 258:
-                        key_name = "Arrow Down"
-                    elif key == 260:
-                        key_name = "Arrow Left"
-                    elif key == 261:
-                        key_name = "Arrow Right"
-                    elif key == 550:
-                        key_name = "Ctrl+Left"
-                    elif key == 565:
-                        key_name = "Ctrl+Right"
-                    elif key == 548:
-                        key_name = "Alt+Left"
-                    elif key == 1:
-                        key_name = "Ctrl+A"
-                    elif key == 5:
-                        key_name = "Ctrl+E"
-                    elif 32 <= key <= 126:
-                        key_name = f"'{chr(key)}'"
+                key_name = _key_name(key)
             except:
                 key_name = "Unknown"
-            safe_addstr(stdscr, 4, 10, key_name)
-            safe_addstr(stdscr, 5, 10, f"0x{key:02x}")
+            safe_addstr(values, 1, 0, key_name)
+            safe_addstr(values, 2, 0, f"0x{key:02x}")
             if 32 <= key <= 126:
-                safe_addstr(stdscr, 6, 10, f"'{chr(key)}'")
+                safe_addstr(values, 3, 0, f"'{chr(key)}'")
             else:
-                safe_addstr(stdscr, 6, 10, "N/A")
+                safe_addstr(values, 3, 0, "N/A")
         except Exception as e:
-            safe_addstr(stdscr, 3, 10, f"Error: {e}")
-        stdscr.refresh()
+            safe_addstr(values, 0, 0, f"Error: {e}")
+        values.noutrefresh()
+        curses.doupdate()
 
 def create_test_file(stdscr):
     settings = get_settings()
@@ -4012,27 +4855,29 @@ def show_tutorial(stdscr):
         "",
         "Press Enter, Space, or ESC to exit..."
     ]
-    display_height = height - 2
+    # The bottom row is kept free for the "more below" indicator
+    display_height = max(1, height - 3)
     start_line = 0
+    
+    # Render the tutorial once; scrolling only changes which pad rows are shown
+    pad = curses.newpad(len(tutorial_text) + 1, width)
+    for i, line in enumerate(tutorial_text):
+        if line == "Daily Journal - Terminal Journal Tutorial":
+            x_pos = max(0, (width - len(line)) // 2)
+            safe_addstr(pad, i, x_pos, line, curses.A_BOLD)
+        else:
+            safe_addstr(pad, i, 0, line)
+    
+    stdscr.erase()
+    safe_addstr(stdscr, 0, 0, "↑/↓ to scroll, Enter/Space/ESC to exit")
     while True:
-        stdscr.clear()
-        safe_addstr(stdscr, 0, 0, "↑/↓ to scroll, Enter/Space/ESC to exit")
-        y_pos = 2
-        for i in range(display_height):
-            line_idx = start_line + i
-            if line_idx < len(tutorial_text):
-                line = tutorial_text[line_idx]
-                if line == "Daily Journal - Terminal Journal Tutorial":
-                    x_pos = max(0, (width - len(line)) // 2)
-                    safe_addstr(stdscr, y_pos, x_pos, line, curses.A_BOLD)
-                else:
-                    safe_addstr(stdscr, y_pos, 0, line)
-                y_pos += 1
-        if start_line > 0:
-            safe_addstr(stdscr, 1, width - 3, "↑")
-        if start_line + display_height < len(tutorial_text):
-            safe_addstr(stdscr, height - 1, width - 3, "↓")
-        stdscr.refresh()
+        # Show scroll indicators
+        safe_addstr(stdscr, 1, width - 3, "↑" if start_line > 0 else " ")
+        safe_addstr(stdscr, height - 1, width - 3, "↓" if start_line + display_height < len(tutorial_text) else " ")
+        
+        stdscr.noutrefresh()
+        pad.noutrefresh(start_line, 0, 2, 0, 2 + display_height - 1, width - 1)
+        curses.doupdate()
         key = stdscr.getch()
         if key == curses.KEY_UP and start_line > 0:
             start_line -= 1
@@ -4112,11 +4957,11 @@ def debug_keyboard_shortcuts(stdscr):
     safe_addstr(stdscr, 1, 0, "Testing platform-specific keyboard shortcuts")
     
     shortcuts = get_platform_shortcuts()
-    platform_name = "Mac" if platform.system() == "Darwin" else "Linux/Windows"
+    platform_name = _PLATFORM_NAME
     settings = get_settings()
     use_mac_shortcuts = settings.get("mac_keyboard_shortcuts", True)
     
-    safe_addstr(stdscr, 3, 0, f"Platform: {platform.system()} ({platform_name})")
+    safe_addstr(stdscr, 3, 0, f"Platform: {_PLATFORM} ({platform_name})")
     safe_addstr(stdscr, 4, 0, f"Mac shortcuts enabled: {use_mac_shortcuts}")
     safe_addstr(stdscr, 5, 0, f"Active shortcuts:")
     
@@ -4197,6 +5042,7 @@ def main():
 def new_blank_entry(stdscr, use_editor=False):
     """Create a new blank journal entry without template selection"""
     ensure_directories()
+    settings = get_settings()
     
     curses.echo()
     stdscr.clear()
@@ -4227,7 +5073,6 @@ def new_blank_entry(stdscr, use_editor=False):
     # Get content from user or external editor
     if use_editor:
         # Use external editor
-        settings = get_settings()
         editor = settings.get("default_editor", "nano")
         
         # Create temporary file for editing
@@ -4267,16 +5112,16 @@ def new_blank_entry(stdscr, use_editor=False):
             return
     
     # Process tags - only use explicitly entered tags, not auto-detected ones
-    settings = get_settings()
     final_tags = tags  # Only use tags from the input field
     
     if settings.get("auto_detect_tags", True) and content:
-        detected_tags = extract_tags_from_content(content)
+        word_count = get_word_count(content)
+        detected_tags = extract_tags_from_content(content, settings.get("tag_prefixes", ["#", "@"]))
         if detected_tags:
             # Show tag detection feedback but don't add them to final_tags
             stdscr.clear()
             stdscr.addstr(0, 0, f"Entry added to: {today_file}")
-            stdscr.addstr(1, 0, f"Words: {get_word_count(content)}")
+            stdscr.addstr(1, 0, f"Words: {word_count}")
             
             if detected_tags:
                 stdscr.addstr(2, 0, f"Auto-detected tags in content: {', '.join(detected_tags)}")
@@ -4290,7 +5135,7 @@ def new_blank_entry(stdscr, use_editor=False):
             # Show that no tags were detected
             stdscr.clear()
             stdscr.addstr(0, 0, f"Entry added to: {today_file}")
-            stdscr.addstr(1, 0, f"Words: {get_word_count(content)}")
+            stdscr.addstr(1, 0, f"Words: {word_count}")
             stdscr.addstr(2, 0, "No tags detected in content")
             stdscr.addstr(3, 0, f"Explicitly entered tags: {tags}")
             stdscr.addstr(4, 0, f"Tags will appear at bottom: {final_tags}")
@@ -4309,7 +5154,7 @@ def new_blank_entry(stdscr, use_editor=False):
     append_to_daily_file(today_file, entry_content)
     
     # Show success message
-    stats = get_file_stats(os.path.join(get_settings()["journal_directory"], today_file))
+    stats = get_file_stats(os.path.join(settings["journal_directory"], today_file))
     stdscr.clear()
     stdscr.addstr(0, 0, f"✅ Entry added to: {today_file}")
     stdscr.addstr(1, 0, f"📊 File stats: {stats['entries']} entries, {stats['words']} words")